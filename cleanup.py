@@ -3,47 +3,77 @@
 # 文件名: cleanup.py
 # 描述: 一键删除项目中的临时文件
 
+import argparse
 import os
 import shutil
-import glob
 import logging
 
-def cleanup_temp_files():
-    """删除项目中的临时文件"""
-    
+def _remove_pycache(path):
+    """
+    删除 __pycache__：通常只含 .pyc 文件，直接 unlink + rmdir；
+    仅当其中出现子目录时才交给 shutil.rmtree。
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+def _clean_tree(path, logger):
+    """
+    单次遍历 path：删除遇到的 __pycache__ 目录（不再深入）与零散的 .pyc 文件。
+    返回 (删除的目录数, 删除的文件数)。逐项日志为 DEBUG 级，默认不输出。
+    """
+    deleted_dirs = 0
+    deleted_files = 0
+    try:
+        it = os.scandir(path)
+    except OSError as e:
+        logger.error("无法遍历 %s: %s", path, e)
+        return deleted_dirs, deleted_files
+
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == '__pycache__':
+                    try:
+                        _remove_pycache(entry.path)
+                        logger.debug("已删除: %s", entry.path)
+                        deleted_dirs += 1
+                    except Exception as e:
+                        logger.error("无法删除 %s: %s", entry.path, e)
+                else:
+                    d, f = _clean_tree(entry.path, logger)
+                    deleted_dirs += d
+                    deleted_files += f
+            elif entry.name.endswith('.pyc'):
+                try:
+                    os.remove(entry.path)
+                    logger.debug("已删除: %s", entry.path)
+                    deleted_files += 1
+                except Exception as e:
+                    logger.error("无法删除 %s: %s", entry.path, e)
+    return deleted_dirs, deleted_files
+
+def cleanup_temp_files(verbose=False):
+    """删除项目中的临时文件；verbose=True 时逐项打印删除路径"""
+
     # 设置日志
-    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO, format='%(asctime)s - %(message)s')
     logger = logging.getLogger()
-    
+
     # 获取当前目录
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # 计数器
-    deleted_dirs = 0
-    deleted_files = 0
-    
-    # 删除所有 __pycache__ 目录
-    for root, dirs, _ in os.walk(current_dir):
-        if '__pycache__' in dirs:
-            pycache_path = os.path.join(root, '__pycache__')
-            try:
-                shutil.rmtree(pycache_path)
-                logger.info(f"已删除: {pycache_path}")
-                deleted_dirs += 1
-            except Exception as e:
-                logger.error(f"无法删除 {pycache_path}: {e}")
-    
-    # 删除所有 .pyc 文件
-    for pyc_file in glob.glob(os.path.join(current_dir, '**/*.pyc'), recursive=True):
-        try:
-            os.remove(pyc_file)
-            logger.info(f"已删除: {pyc_file}")
-            deleted_files += 1
-        except Exception as e:
-            logger.error(f"无法删除 {pyc_file}: {e}")
-    
+
+    # 一次遍历同时删除 __pycache__ 目录与 .pyc 文件
+    deleted_dirs, deleted_files = _clean_tree(current_dir, logger)
+
     # 总结
-    logger.info(f"清理完成! 已删除 {deleted_dirs} 个目录和 {deleted_files} 个文件")
+    logger.info("清理完成! 已删除 %d 个目录和 %d 个文件", deleted_dirs, deleted_files)
 
 if __name__ == "__main__":
-    cleanup_temp_files()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="删除项目中的 __pycache__ 目录与 .pyc 文件")
+    parser.add_argument("-v", "--verbose", action="store_true", help="逐项打印已删除的路径")
+    cleanup_temp_files(verbose=parser.parse_args().verbose)
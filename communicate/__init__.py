@@ -1,9 +1,65 @@
-from .protocol import *
-from .serial_app import *
+import importlib
+
+# 按需导入：只用协议定义/编解码时不会连带导入 pyserial 与串口应用层
+_LAZY = {
+    # 串口应用层（serial_app）
+    "init_serial": "serial_app",
+    "start_serial": "serial_app",
+    "stop_serial": "serial_app",
+    "get_serial": "serial_app",
+    "scan_serial_ports": "serial_app",
+    "invalidate_ports_cache": "serial_app",
+    "ports_list": "serial_app",
+    "select_serial_port": "serial_app",
+    "save_serial_config": "serial_app",
+    "send_data_bytes": "serial_app",
+    "send_tlvs": "serial_app",
+    "send_kv": "serial_app",
+    "send_packed": "serial_app",
+    "get_latest_frame": "serial_app",
+    "get_latest_decoded": "serial_app",
+    "get_recent_frames": "serial_app",
+    "reset_latest": "serial_app",
+    # 串口驱动
+    "SyncSerial": "serial",
+    "SerialConfig": "serial",
+    # 协议层
+    "DataEncoder": "protocol.protocol_py.data",
+    "DataDecoder": "protocol.protocol_py.data",
+    "DataCodec": "protocol.protocol_py.data",
+    "DataPacket": "protocol.protocol_py.data",
+    "STRUCT_BY_VTYPE": "protocol.protocol_py.data",
+    "UNPACK_BY_VTYPE": "protocol.protocol_py.data",
+    "FrameEncoder": "protocol.protocol_py.frame",
+    "FrameDecoder": "protocol.protocol_py.frame",
+    "FrameCodec": "protocol.protocol_py.frame",
+    "Msg": "protocol.protocol_py.protocol_defs",
+    "Var": "protocol.protocol_py.protocol_defs",
+    "VAR_META": "protocol.protocol_py.protocol_defs",
+    "VType": "protocol.protocol_py.protocol_defs",
+    "VAR_VTYPE_TBL": "protocol.protocol_py.protocol_defs",
+    "VAR_KEY_TBL": "protocol.protocol_py.protocol_defs",
+    "key_of": "protocol.protocol_py.protocol_defs",
+    "KEY_TO_VAR": "protocol.protocol_py.protocol_defs",
+    "size_of": "protocol.protocol_py.protocol_defs",
+    "vtype_of": "protocol.protocol_py.protocol_defs",
+}
+
+def __getattr__(name):
+    try:
+        mod_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    val = getattr(importlib.import_module("." + mod_name, __name__), name)
+    globals()[name] = val  # 缓存，后续访问不再经过 __getattr__
+    return val
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     "init_serial",
     "start_serial",
     "stop_serial",
     "get_serial"
-]
\ No newline at end of file
+]
@@ -1,13 +1,27 @@
-from .protocol_py import *
+from .protocol_py import (
+    DataEncoder, DataDecoder, DataCodec, STRUCT_BY_VTYPE, UNPACK_BY_VTYPE,
+    FrameEncoder, FrameDecoder, FrameCodec,
+    Msg, Var, VAR_META,
+    VType, VAR_VTYPE_TBL, VAR_KEY_TBL, key_of, KEY_TO_VAR, size_of, vtype_of,
+)
 
 __all__ = [
     "DataEncoder",
     "DataDecoder",
     "DataCodec",
+    "STRUCT_BY_VTYPE",
+    "UNPACK_BY_VTYPE",
     "FrameEncoder",
     "FrameDecoder",
     "FrameCodec",
     "Msg",
     "Var",
     "VAR_META",
+    "VType",
+    "VAR_VTYPE_TBL",
+    "VAR_KEY_TBL",
+    "key_of",
+    "KEY_TO_VAR",
+    "size_of",
+    "vtype_of",
 ]
@@ -3,20 +3,30 @@
 """
 从 variables.yaml 读取 (变量名, 变量类型)：
 - 为每个变量名分配稳定的 1B ID（FNV-1a 8-bit；碰撞自动规避）
-- 基于当前 UTC 秒级时间生成数据层版本号
+- 基于变量表内容（变量名/类型/ID）生成确定性的数据层版本号；--timestamp 时改用当前 UTC 秒级时间
 - 生成 Python 与 C 的协议定义文件
+- 产物首部写入 CONTENT_HASH；输入未变化时跳过重写（保留原版本号与 mtime），--force 强制重新生成
 
 生成物：
 - protocol_defs.py
-    PROTOCOL_DATA_VER_FULL: int = YYYYMMDDHHMMSS (UTC)
+    PROTOCOL_DATA_VER_FULL: int = blake2b-64(变量表)（--timestamp: YYYYMMDDHHMMSS (UTC)）
     PROTOCOL_DATA_VER     : int = (PROTOCOL_DATA_VER_FULL & 0xFF)
     Msg(IntEnum)          : PC_TO_MCU, MCU_TO_PC
     Var(IntEnum)          : 变量名 -> 稳定 ID（0x01..0xEF）
-    VAR_META              : { vid: {"key": <yaml-name>, "vtype": <str>, "size": <int|None>} }
-    VAR_FIXED_SIZE        : {int(Var.*): 固定字节数}（BYTES 不进入此表）
+    VAR_BY_ID / MSG_BY_ID : {int: 枚举成员}，解码时 dict.get 代替 Enum 构造 + try/except
+    V_<NAME> / M_<NAME>   : 与 Var/Msg 成员同值的纯 int 常量，供热路径使用；枚举仍用于 UI/调试
+    VAR_META              : { vid: VarMeta(key=<yaml-name>, vtype=<str>, size=<int|None>) }（键为 ID 字面量；只读 MappingProxyType）
+    VAR_FIXED_SIZE        : {vid: 固定字节数}（BYTES 不进入此表）
+    VAR_SIZE_TABLE        : bytes(256)，下标为 ID，值为固定字节数；0 表示可变长/未定义（同 C 端）
+    VType(IntEnum)        : 类型码（规范名 + 别名），0 = UNKNOWN
+    VAR_VTYPE_TBL         : bytes(256)，下标为 ID，值为 VType 码；未定义为 0
+    VAR_KEY_TBL / key_of  : 256 项元组，下标为 ID，值为驻留的 key 字符串；未定义为 None
+    KEY_TO_VAR            : {key: Var}，按 YAML 变量名反查
+    size_of / vtype_of    : 按 ID 下标上述并列表（SoA）的薄访问器
+    Var.__fixed_size__ / Var.__vtype__ : 同上两张 bytes(256) 表，挂在枚举类上
 
 - protocol_c/data_defs.h
-    #define PROTOCOL_DATA_VER_FULL  YYYYMMDDHHMMSSULL
+    #define PROTOCOL_DATA_VER_FULL  <FULL>ULL
     #define PROTOCOL_DATA_VER       0x??
     #define MSG_PC_TO_MCU           0x01
     #define MSG_MCU_TO_PC           0x02
@@ -38,6 +48,10 @@ YAML 输入（二选一）:
 """
 
 from __future__ import annotations
+import argparse
+import hashlib
+import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
@@ -49,6 +63,12 @@ except ImportError:
     print("Please `pip install pyyaml`", file=sys.stderr)
     sys.exit(1)
 
+# 优先使用 libyaml 的 C 解析器；未编译 libyaml 时退回纯 Python 实现
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
+
 # 路径（脚本与 variables.yaml、输出文件位于同一目录）
 ROOT = Path(__file__).resolve().parent
 SPEC = ROOT / "variables.yaml"
@@ -81,13 +101,37 @@ VALID_TYPES: Dict[str, Optional[int]] = {
     "BYTES": None, "STR": None, "STRING": None, "UTF8": None, "ASCII": None,
 }
 
+# 类型码（VType，1 字节）：规范名取唯一码值，别名复用规范名的码值；0 保留为“未定义”
+VTYPE_CODES: Dict[str, int] = {
+    "UNKNOWN": 0,
+    "U8": 1, "I8": 2, "BOOL": 3,
+    "U16LE": 4, "I16LE": 5, "U16BE": 6, "I16BE": 7,
+    "U32LE": 8, "I32LE": 9, "U32BE": 10, "I32BE": 11,
+    "F32LE": 12, "F32BE": 13,
+    "BYTES": 14, "STR": 15,
+    # ---- 别名 ----
+    "BYTE": 1,
+    "U16": 4, "I16": 5,
+    "U32": 8, "I32": 9, "F32": 12,
+    "STRING": 15, "UTF8": 15, "ASCII": 15,
+}
+
+# 生成模板修订号：输出格式变化时递增，使已有产物的 CONTENT_HASH 失效
+GEN_REV = 13
+
+# 产物首部的指纹行（Python: "# CONTENT_HASH: …"，C: "// CONTENT_HASH: …"）
+_CONTENT_HASH_RE = re.compile(r"^(?:#|//) CONTENT_HASH: ([0-9a-f]+)\s*$")
+
 # -------- FNV-1a 8-bit（稳定且简单）--------
+# 8-bit 状态下单步 ((h ^ b) * 0x1B) & 0xFF 只有 256×256 种输入，预先查表
+_FNV_STEP = bytes(((h ^ b) * 0x1B) & 0xFF for h in range(256) for b in range(256))
+
 def fnv1a8(s: str, salt: int = 0) -> int:
     # 8-bit FNV-1a：offset basis 0xCB, prime 0x1B（任选，只要稳定）
     h = (0xCB ^ (salt & 0xFF)) & 0xFF
+    step = _FNV_STEP
     for ch in s.encode("utf-8"):
-        h ^= ch
-        h = (h * 0x1B) & 0xFF
+        h = step[(h << 8) | ch]
     return h
 
 def assign_ids(names: List[str]) -> Dict[str, int]:
@@ -95,26 +139,33 @@ def assign_ids(names: List[str]) -> Dict[str, int]:
     为变量名分配 0x01..0xEF 的稳定 ID：
     - 先按变量名字典序遍历，确保确定性
     - 首选 hash；冲突则更换 salt 再 hash；极端情况下线性探测空位
+    - 已占用 ID 以 256 位整数位图记录（bit i 置 1 表示 ID i 不可用）
     """
-    used = set(RESERVED_IDS)
+    used_mask = 0
+    for rid in RESERVED_IDS:
+        used_mask |= 1 << rid
+    # 区间外的 ID 也视为占用，探测时只需一次位测试
+    for rid in range(0x100):
+        if rid < ID_SPACE_MIN or rid > ID_SPACE_MAX:
+            used_mask |= 1 << rid
     out: Dict[str, int] = {}
 
     for name in sorted(names):
         found = None
         for salt in range(256):
             hid = fnv1a8(name, salt)
-            if hid < ID_SPACE_MIN or hid > ID_SPACE_MAX or hid in used:
+            if used_mask >> hid & 1:
                 continue
             found = hid
             break
         if found is None:
             for cand in range(ID_SPACE_MIN, ID_SPACE_MAX + 1):
-                if cand not in used:
+                if not used_mask >> cand & 1:
                     found = cand
                     break
         if found is None:
             raise RuntimeError("ID pool exhausted; adjust RESERVED_IDS or reduce variables.")
-        used.add(found)
+        used_mask |= 1 << found
         out[name] = found
     return out
 
@@ -128,7 +179,7 @@ def load_variables() -> List[Tuple[str, str, str]]:
     if not SPEC.exists():
         raise FileNotFoundError(f"spec file not found: {SPEC}")
 
-    doc = yaml.safe_load(SPEC.read_text(encoding="utf-8")) or {}
+    doc = yaml.load(SPEC.read_text(encoding="utf-8"), Loader=CSafeLoader) or {}
 
     items: List[Tuple[str, str, str]] = []
     if "variables" in doc and doc["variables"]:
@@ -159,139 +210,277 @@ def load_variables() -> List[Tuple[str, str, str]]:
         cleaned.append((enum_name, vtype, key))
     return cleaned
 
-def build_time_versions() -> tuple[int, int]:
+def build_time_versions(now: datetime) -> tuple[int, int]:
     """
-    生成秒级版本：
+    生成秒级版本（--timestamp）：
     - PROTOCOL_DATA_VER_FULL = YYYYMMDDHHMMSS (UTC)
     - PROTOCOL_DATA_VER      = PROTOCOL_DATA_VER_FULL & 0xFF (1 字节写入 DATA 头)
     """
-    now = datetime.now(timezone.utc)
     full = int(now.strftime("%Y%m%d%H%M%S"))  # 例如 20250903142517
     short = full & 0xFF
     return full, short
 
+def content_versions(vars_list: List[Tuple[str, str, str]], id_map: Dict[str, int]) -> tuple[int, int]:
+    """
+    生成内容版本（默认）：
+    - PROTOCOL_DATA_VER_FULL = blake2b-64(按变量名排序的 "名:类型:ID")
+    - PROTOCOL_DATA_VER      = PROTOCOL_DATA_VER_FULL & 0xFF (1 字节写入 DATA 头)
+    变量表不变则版本不变，重复生成不会迫使 MCU 重新烧录。
+    """
+    canon = b"\x00".join(f"{n}:{v}:{id_map[n]}".encode("utf-8") for n, v, _ in sorted(vars_list))
+    full = int.from_bytes(hashlib.blake2b(canon, digest_size=8).digest(), "big")
+    short = full & 0xFF
+    return full, short
+
+def version_policy(timestamp: bool) -> str:
+    return "YYYYMMDDHHMMSS (UTC)" if timestamp else "blake2b-64(sorted NAME:VTYPE:ID)"
+
+def build_versions(vars_list: List[Tuple[str, str, str]], id_map: Dict[str, int],
+                   now: datetime, timestamp: bool = False) -> tuple[int, int]:
+    return build_time_versions(now) if timestamp else content_versions(vars_list, id_map)
+
+def content_hash(vars_list: List[Tuple[str, str, str]], timestamp: bool = False) -> str:
+    """
+    产物指纹：blake2b(变量表 + 类型表 + 版本策略 + 模板修订号)，与变量声明顺序无关。
+    """
+    canon = repr((sorted(vars_list), sorted(VALID_TYPES.items()), sorted(VTYPE_CODES.items()), version_policy(timestamp), GEN_REV))
+    return hashlib.blake2b(canon.encode("utf-8"), digest_size=8).hexdigest()
+
+def read_content_hash(path: Path) -> Optional[str]:
+    """读取已有产物前几行中的 CONTENT_HASH；文件不存在或未找到时返回 None。"""
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            for _, line in zip(range(5), f):
+                m = _CONTENT_HASH_RE.match(line)
+                if m:
+                    return m.group(1)
+    except FileNotFoundError:
+        pass
+    return None
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """内容不同才写入（临时文件 + os.replace）；返回是否写入。"""
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
 # ---------- Python 输出 ----------
-def gen_protocol_defs_py(vars_list: List[Tuple[str, str, str]]) -> str:
-    # vars_list: (ENUM_NAME, VTYPE, KEY_NAME)
-    names = [enum_name for enum_name, _, _ in vars_list]
-    id_map = assign_ids(names)
-
-    # 固定宽度表
-    fixed_items = []
-    for enum_name, vtype, _ in vars_list:
-        size = VALID_TYPES[vtype]
-        if size is not None:
-            fixed_items.append((enum_name, id_map[enum_name], size))
-
-    # VAR_META：vid -> {"key": key_name, "vtype": vtype, "size": size or None}
-    meta_items = []
-    for enum_name, vtype, key_name in vars_list:
-        vid = id_map[enum_name]
-        size = VALID_TYPES[vtype]
-        meta_items.append((enum_name, vid, key_name, vtype, size))
-
-    full_ver, short_ver = build_time_versions()
-
-    lines: List[str] = []
-    lines.append("# Auto-generated. DO NOT EDIT MANUALLY.")
-    lines.append(f"# Generated at UTC {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("# Version policy:")
-    lines.append("#   PROTOCOL_DATA_VER_FULL = YYYYMMDDHHMMSS (UTC)")
-    lines.append("#   PROTOCOL_DATA_VER      = PROTOCOL_DATA_VER_FULL & 0xFF  # 1-byte for DATA header")
-    lines.append("")
-    lines.append("from enum import IntEnum")
-    lines.append("from typing import Dict, Optional, TypedDict")
-    lines.append("")
-    lines.append(f"PROTOCOL_DATA_VER_FULL: int = {full_ver}")
-    lines.append(f"PROTOCOL_DATA_VER: int = 0x{short_ver:02X}")
-    lines.append("")
-    lines.append("class Msg(IntEnum):")
-    lines.append("    PC_TO_MCU = 0x01")
-    lines.append("    MCU_TO_PC = 0x02")
-    lines.append("")
-    lines.append("class Var(IntEnum):")
-    # 以 ID 顺序输出，便于 MCU 查表/阅读
-    for enum_name, _, _ in sorted(vars_list, key=lambda x: id_map[x[0]]):
-        vid = id_map[enum_name]
-        vtype = next(v for n, v, _ in vars_list if n == enum_name)
-        lines.append(f"    {enum_name} = 0x{vid:02X}  # {vtype}")
-    lines.append("")
-    lines.append("class VarMeta(TypedDict, total=False):")
-    lines.append("    key: str       # 原始键（YAML 中的 name，用于 UI/业务）")
-    lines.append("    vtype: str     # 变量类型字符串（如 U16LE/F32/…）")
-    lines.append("    size: Optional[int]  # 固定长度；可变长(BYTES/STR/…)为 None")
-    lines.append("")
-    lines.append("VAR_META: Dict[int, VarMeta] = {")
-    for enum_name, vid, key_name, vtype, size in sorted(meta_items, key=lambda x: x[1]):
-        key_s = key_name.replace('\\', '\\\\').replace('"', '\\"')
-        lines.append(f'    int(Var.{enum_name}): {{"key": "{key_s}", "vtype": "{vtype}", "size": {repr(size)}}},')
-    lines.append("}")
-    lines.append("")
-    lines.append("VAR_FIXED_SIZE: Dict[int, int] = {")
-    for enum_name, vid, size in sorted(fixed_items, key=lambda x: x[1]):
-        lines.append(f"    int(Var.{enum_name}): {size},")
-    lines.append("}")
-    lines.append("")
-    lines.append("# 说明：")
-    lines.append("# - BYTES/STR 等可变长类型不在 VAR_FIXED_SIZE 中；按 TLV 的 L 解析。")
-    lines.append("# - 编解码逻辑由其他模块实现；此文件仅提供 ID/类型/长度元信息。")
-    return "\n".join(lines) + "\n"
+_PY_TEMPLATE = '''\
+# Auto-generated. DO NOT EDIT MANUALLY.
+# CONTENT_HASH: {digest}
+# Generated at UTC {generated_at}
+# Version policy:
+#   PROTOCOL_DATA_VER_FULL = {policy}
+#   PROTOCOL_DATA_VER      = PROTOCOL_DATA_VER_FULL & 0xFF  # 1-byte for DATA header
+
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+PROTOCOL_DATA_VER_FULL: int = {full_ver}
+PROTOCOL_DATA_VER: int = 0x{short_ver:02X}
+
+class Msg(IntEnum):
+    PC_TO_MCU = 0x01
+    MCU_TO_PC = 0x02
+
+class Var(IntEnum):
+{var_lines}
+# ID → 枚举成员；未知 ID 用 .get(x, x) 保留原始整数
+VAR_BY_ID: Dict[int, Var] = {{int(v): v for v in Var}}
+MSG_BY_ID: Dict[int, Msg] = {{int(m): m for m in Msg}}
+
+# 纯 int 别名：热路径比较/作 dict 键时用，省去 IntEnum 成员的类属性查找（约 0.1 us/次）
+M_PC_TO_MCU = 0x01
+M_MCU_TO_PC = 0x02
+{alias_lines}
+class VarMeta(NamedTuple):
+    key: str       # 原始键（YAML 中的 name，用于 UI/业务）
+    vtype: str     # 变量类型字符串（如 U16LE/F32/…）；类型码见 VAR_VTYPE_TBL
+    size: Optional[int]  # 固定长度；可变长(BYTES/STR/…)为 None
+
+# 只读视图：外层映射不可修改，每项 VarMeta 本身为不可变元组
+VAR_META: Mapping[int, VarMeta] = MappingProxyType({{
+{meta_lines}}})
+
+VAR_FIXED_SIZE: Dict[int, int] = {{
+{fixed_lines}}}
+
+# ID → key 的 256 项元组（驻留字符串；未定义为 None），UI/日志取名时直接下标
+VAR_KEY_TBL: Tuple[Optional[str], ...] = tuple(
+    sys.intern(VAR_META[i].key) if i in VAR_META else None for i in range(256)
+)
+
+def key_of(vid: int) -> Optional[str]:
+    """按 ID（0..255）取变量的 key；未定义的 ID 返回 None。"""
+    return VAR_KEY_TBL[vid]
+
+# key → 枚举成员（反查表），按 YAML 变量名编码时一次 dict 查找
+KEY_TO_VAR: Dict[str, Var] = {{meta.key: VAR_BY_ID[vid] for vid, meta in VAR_META.items()}}
+
+# 256 项尺寸查表（下标为 ID；0 表示可变长/未定义，与 C 端 VAR_SIZE_TABLE 一致）
+VAR_SIZE_TABLE: bytes = bytes((
+{table_lines}))
+
+class VType(IntEnum):
+{vtype_lines}
+# 256 项类型码查表（下标为 ID；值为 VType，0 表示未定义），解码分派时代替 vtype 字符串比较
+VAR_VTYPE_TBL: bytes = bytes((
+{vtype_table_lines}))
+
+# 查表挂到 Var 类上，与枚举同生命周期；只拿到 Var 类的调用方一次属性访问即可下标
+Var.__fixed_size__ = VAR_SIZE_TABLE
+Var.__vtype__ = VAR_VTYPE_TBL
+
+# 码值 → 规范 VType 成员（别名不单独占位）
+_VTYPE_BY_CODE: Tuple[VType, ...] = tuple(VType(c) for c in range(max(VType) + 1))
+
+def size_of(vid: int) -> int:
+    """按 ID（0..255）取固定字节数；可变长/未定义为 0。"""
+    return VAR_SIZE_TABLE[vid]
+
+def vtype_of(vid: int) -> VType:
+    """按 ID（0..255）取规范 VType；未定义为 VType.UNKNOWN。"""
+    return _VTYPE_BY_CODE[VAR_VTYPE_TBL[vid]]
+
+# 说明：
+# - BYTES/STR 等可变长类型不在 VAR_FIXED_SIZE 中；按 TLV 的 L 解析。
+# - 编解码逻辑由其他模块实现；此文件仅提供 ID/类型/长度元信息。
+'''
+
+def _py_str(s: str) -> str:
+    return s.replace('\\', '\\\\').replace('"', '\\"')
+
+def gen_protocol_defs_py(vars_list: List[Tuple[str, str, str]], id_map: Dict[str, int],
+                         full_ver: int, short_ver: int, digest: str, generated_at: datetime,
+                         timestamp: bool = False) -> str:
+    # vars_list: (ENUM_NAME, VTYPE, KEY_NAME)；以 ID 顺序输出，便于 MCU 查表/阅读
+    by_id = sorted(vars_list, key=lambda x: id_map[x[0]])
+    fixed = [(n, VALID_TYPES[v]) for n, v, _ in by_id if VALID_TYPES[v] is not None]
+
+    var_lines = "".join(f"    {n} = 0x{id_map[n]:02X}  # {v}\n" for n, v, _ in by_id)
+    alias_lines = "".join(f"V_{n} = 0x{id_map[n]:02X}\n" for n, _, _ in by_id)
+    # VAR_META：vid -> VarMeta(key_name, vtype, size or None)
+    meta_lines = "".join(
+        f'    0x{id_map[n]:02X}: VarMeta("{_py_str(k)}", "{v}", {VALID_TYPES[v]!r}),  # Var.{n}\n'
+        for n, v, k in by_id
+    )
+    fixed_lines = "".join(f"    0x{id_map[n]:02X}: {size},  # Var.{n}\n" for n, size in fixed)
+    table = [0] * 256
+    for n, size in fixed:
+        table[id_map[n]] = size
+    table_lines = "".join(
+        "    " + " ".join(f"{x}," for x in table[row:row + 16]) + f"  # 0x{row:02X}\n"
+        for row in range(0, 256, 16)
+    )
+    # VType：按码值输出，规范名在前、别名随后（IntEnum 同值成员即别名）
+    vtype_lines = "".join(f"    {name} = {code}\n" for name, code in VTYPE_CODES.items())
+    vtable = [0] * 256
+    for n, v, _ in by_id:
+        vtable[id_map[n]] = VTYPE_CODES[v]
+    vtype_table_lines = "".join(
+        "    " + " ".join(f"{x}," for x in vtable[row:row + 16]) + f"  # 0x{row:02X}\n"
+        for row in range(0, 256, 16)
+    )
+
+    return _PY_TEMPLATE.format(
+        digest=digest,
+        generated_at=generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+        policy=version_policy(timestamp),
+        full_ver=full_ver,
+        short_ver=short_ver,
+        var_lines=var_lines,
+        alias_lines=alias_lines,
+        meta_lines=meta_lines,
+        fixed_lines=fixed_lines,
+        table_lines=table_lines,
+        vtype_lines=vtype_lines,
+        vtype_table_lines=vtype_table_lines,
+    )
 
 # ---------- C 输出 ----------
-def gen_c_header(vars_list: List[Tuple[str, str, str]]) -> str:
+_C_TEMPLATE = '''\
+// Auto-generated. DO NOT EDIT MANUALLY.
+// CONTENT_HASH: {digest}
+// Generated at UTC {generated_at}
+#ifndef PROTOCOL_DEFS_H
+#define PROTOCOL_DEFS_H
+#include <stdint.h>
+
+#define PROTOCOL_DATA_VER_FULL  {full_ver}ULL
+#define PROTOCOL_DATA_VER       0x{short_ver:02X}
+
+// MSG roles
+#define MSG_PC_TO_MCU 0x01
+#define MSG_MCU_TO_PC 0x02
+
+// Variable IDs (T in TLV)
+{id_lines}
+// Fixed sizes (only for fixed-width variables); others are variable-length per TLV L
+{size_lines}
+static const uint8_t VAR_SIZE_TABLE[256] = {{
+{table_lines}    // others default to 0 (variable-length)
+}};
+
+#endif // PROTOCOL_DEFS_H
+
+'''
+
+def gen_c_header(vars_list: List[Tuple[str, str, str]], id_map: Dict[str, int],
+                 full_ver: int, short_ver: int, digest: str, generated_at: datetime) -> str:
     # vars_list: (ENUM_NAME, VTYPE, KEY_NAME)
-    names = [enum_name for enum_name, _, _ in vars_list]
-    id_map = assign_ids(names)
-    full_ver, short_ver = build_time_versions()
-
-    # 固定宽度
-    fixed = {enum_name: VALID_TYPES[vtype] for enum_name, vtype, _ in vars_list if VALID_TYPES[vtype] is not None}
-
-    lines: List[str] = []
-    lines.append("// Auto-generated. DO NOT EDIT MANUALLY.")
-    lines.append(f"// Generated at UTC {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("#ifndef PROTOCOL_DEFS_H")
-    lines.append("#define PROTOCOL_DEFS_H")
-    lines.append("#include <stdint.h>")
-    lines.append("")
-    lines.append(f"#define PROTOCOL_DATA_VER_FULL  {full_ver}ULL")
-    lines.append(f"#define PROTOCOL_DATA_VER       0x{(full_ver & 0xFF):02X}")
-    lines.append("")
-    lines.append("// MSG roles")
-    lines.append("#define MSG_PC_TO_MCU 0x01")
-    lines.append("#define MSG_MCU_TO_PC 0x02")
-    lines.append("")
-    lines.append("// Variable IDs (T in TLV)")
-    for enum_name, _, _ in sorted(vars_list, key=lambda x: id_map[x[0]]):
-        lines.append(f"#define VAR_{enum_name} 0x{id_map[enum_name]:02X}")
-    lines.append("")
-    lines.append("// Fixed sizes (only for fixed-width variables); others are variable-length per TLV L")
-    for enum_name, size in sorted(fixed.items(), key=lambda x: id_map[x[0]]):
-        lines.append(f"#define VAR_{enum_name}_SIZE {size}")
-    lines.append("")
-    # 生成 256 项尺寸查表（未声明者为 0）
-    lines.append("static const uint8_t VAR_SIZE_TABLE[256] = {")
-    for enum_name, size in sorted(fixed.items(), key=lambda x: id_map[x[0]]):
-        lines.append(f"    [VAR_{enum_name}] = {size},")
-    lines.append("    // others default to 0 (variable-length)")
-    lines.append("};")
-    lines.append("")
-    lines.append("#endif // PROTOCOL_DEFS_H")
-    lines.append("")
-    return "\n".join(lines) + "\n"
-
-def main():
+    by_id = sorted(vars_list, key=lambda x: id_map[x[0]])
+    fixed = [(n, VALID_TYPES[v]) for n, v, _ in by_id if VALID_TYPES[v] is not None]
+
+    # 256 项尺寸查表只列固定宽度变量（未声明者为 0）
+    return _C_TEMPLATE.format(
+        digest=digest,
+        generated_at=generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+        full_ver=full_ver,
+        short_ver=short_ver,
+        id_lines="".join(f"#define VAR_{n} 0x{id_map[n]:02X}\n" for n, _, _ in by_id),
+        size_lines="".join(f"#define VAR_{n}_SIZE {size}\n" for n, size in fixed),
+        table_lines="".join(f"    [VAR_{n}] = {size},\n" for n, size in fixed),
+    )
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="generate protocol_defs.py / protocol_defs.h from variables.yaml")
+    parser.add_argument("--force", action="store_true", help="ignore CONTENT_HASH and always regenerate")
+    parser.add_argument("--timestamp", action="store_true",
+                        help="stamp PROTOCOL_DATA_VER_FULL with current UTC time instead of the content hash")
+    args = parser.parse_args(argv)
+
     vars_list = load_variables()  # List[(ENUM_NAME, VTYPE, KEY_NAME)]
+    digest = content_hash(vars_list, args.timestamp)
+
+    # 两个产物共享同一版本号：任一过期则一起重新生成
+    if not args.force and read_content_hash(PY_OUT) == digest and read_content_hash(C_OUT) == digest:
+        print(f"up to date (CONTENT_HASH {digest}), skipped")
+        return
+
+    # ID、版本号与生成时间只计算一次，Python/C 两份产物共用，保证完全一致
+    id_map = assign_ids([enum_name for enum_name, _, _ in vars_list])
+    generated_at = datetime.now(timezone.utc)
+    full_ver, short_ver = build_versions(vars_list, id_map, generated_at, args.timestamp)
 
     # Python
     PY_DIR.mkdir(parents=True, exist_ok=True)
-    PY_OUT.write_text(gen_protocol_defs_py(vars_list), encoding="utf-8")
-    print(f"wrote {PY_OUT}")
+    if write_if_changed(PY_OUT, gen_protocol_defs_py(vars_list, id_map, full_ver, short_ver, digest,
+                                                     generated_at, args.timestamp)):
+        print(f"wrote {PY_OUT}")
 
     # C
     C_DIR.mkdir(parents=True, exist_ok=True)
-    C_OUT.write_text(gen_c_header(vars_list), encoding="utf-8")
-    print(f"wrote {C_OUT}")
+    if write_if_changed(C_OUT, gen_c_header(vars_list, id_map, full_ver, short_ver, digest, generated_at)):
+        print(f"wrote {C_OUT}")
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,12 @@
 // Auto-generated. DO NOT EDIT MANUALLY.
-// Generated at UTC 2025-09-27 03:48:44
+// CONTENT_HASH: 8ead682ee4b7f0c3
+// Generated at UTC 2026-10-16 10:56:11
 #ifndef PROTOCOL_DEFS_H
 #define PROTOCOL_DEFS_H
 #include <stdint.h>
 
-#define PROTOCOL_DATA_VER_FULL  20250927034844ULL
-#define PROTOCOL_DATA_VER       0xDC
+#define PROTOCOL_DATA_VER_FULL  2052627596838202747ULL
+#define PROTOCOL_DATA_VER       0x7B
 
 // MSG roles
 #define MSG_PC_TO_MCU 0x01
@@ -1,15 +1,27 @@
-from .data import DataEncoder, DataDecoder, DataCodec
+from .data import DataEncoder, DataDecoder, DataCodec, STRUCT_BY_VTYPE, UNPACK_BY_VTYPE
 from .frame import FrameEncoder, FrameDecoder, FrameCodec
-from .protocol_defs import Msg, Var, VAR_META
+from .protocol_defs import (
+    Msg, Var, VAR_META,
+    VType, VAR_VTYPE_TBL, VAR_KEY_TBL, key_of, KEY_TO_VAR, size_of, vtype_of,
+)
 
 __all__ = [
     "DataEncoder",
     "DataDecoder",
     "DataCodec",
+    "STRUCT_BY_VTYPE",
+    "UNPACK_BY_VTYPE",
     "FrameEncoder",
     "FrameDecoder",
     "FrameCodec",
     "Msg",
     "Var",
     "VAR_META",
+    "VType",
+    "VAR_VTYPE_TBL",
+    "VAR_KEY_TBL",
+    "key_of",
+    "KEY_TO_VAR",
+    "size_of",
+    "vtype_of",
 ]
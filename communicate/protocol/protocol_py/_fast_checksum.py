@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+可选的 numba 加速校验和内核。
+
+numba/numpy 任一不可用时 sum_u8 为 None，调用方自行退回纯 Python 实现。
+导入本模块即导入 numba（约 0.3 s），frame.py 只在首次遇到长 DATA 时才导入它。
+"""
+from __future__ import annotations
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    sum_u8 = None
+else:
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _sum_u8(a):  # a: uint8[:]
+        s = np.uint32(0)
+        for i in range(a.shape[0]):
+            s += a[i]
+        return s
+
+    def sum_u8(buf) -> int:
+        """对单字节缓冲（bytes/bytearray/'B' 格式 memoryview）逐字节求和（未取模）。"""
+        return int(_sum_u8(np.frombuffer(buf, dtype=np.uint8)))
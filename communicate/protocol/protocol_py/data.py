@@ -1,23 +1,65 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple, Union, Any, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple, Union, Any, Optional
 import struct
 
-from .protocol_defs import Msg, Var, VAR_FIXED_SIZE, PROTOCOL_DATA_VER, VAR_META
+from .protocol_defs import (
+    Msg, Var, VType, VAR_SIZE_TABLE, VAR_VTYPE_TBL, PROTOCOL_DATA_VER, VAR_BY_ID, MSG_BY_ID, KEY_TO_VAR,
+)
 
 BytesLike = Union[bytes, bytearray, memoryview]
 VarId = Union[Var, int]
+VarKey = Union[Var, int, str]  # encode_kv 另接受 YAML 变量名（如 "imu_reset"）
 
 # ===============================
 # 基础工具
 # ===============================
-def _u8(x: int) -> int:
-    return x & 0xFF
+# 常用定长（1/2/4 字节，小端无符号）预编译打包器
+_PACKERS = {1: struct.Struct("<B").pack, 2: struct.Struct("<H").pack, 4: struct.Struct("<I").pack}
+_U8 = struct.Struct("<B").unpack_from
+_U16 = struct.Struct("<H").unpack_from
+_U32 = struct.Struct("<I").unpack_from
+_F32 = struct.Struct("<f").unpack_from
+_UNPACKERS = {1: _U8, 2: _U16, 4: _U32}
+_PACK_F32 = struct.Struct("<f").pack
+
+# 按 VType 码下标的预编译 Struct（区分有符号/BE）；可变长与 UNKNOWN 为 None
+_VTYPE_FORMATS: Dict[int, str] = {
+    VType.U8: "<B", VType.I8: "<b", VType.BOOL: "<B",
+    VType.U16LE: "<H", VType.I16LE: "<h", VType.U16BE: ">H", VType.I16BE: ">h",
+    VType.U32LE: "<I", VType.I32LE: "<i", VType.U32BE: ">I", VType.I32BE: ">i",
+    VType.F32LE: "<f", VType.F32BE: ">f",
+}
+STRUCT_BY_VTYPE: Tuple[Optional[struct.Struct], ...] = tuple(
+    struct.Struct(_VTYPE_FORMATS[c]) if c in _VTYPE_FORMATS else None for c in range(max(VType) + 1)
+)
+# 用法：val, = UNPACK_BY_VTYPE[VAR_VTYPE_TBL[vid]](buf, off)
+UNPACK_BY_VTYPE: Tuple[Optional[Callable[..., tuple]], ...] = tuple(
+    s.unpack_from if s is not None else None for s in STRUCT_BY_VTYPE
+)
+
+# 按 T 字节（0..255）直接下标的派生表，只读生成的并列表（SoA），不经过 VAR_META
+_SIZE_BY_TAG: Tuple[Optional[int], ...] = tuple(size or None for size in VAR_SIZE_TABLE)
+_IS_F32 = bytes(1 if c == VType.F32LE else 0 for c in VAR_VTYPE_TBL)
+
+def fixed_size(t_id: int) -> Optional[int]:
+    """查表得到变量的固定字节数；可变长或未定义的 ID 返回 None。"""
+    if 0 <= t_id <= 0xFF:
+        return _SIZE_BY_TAG[t_id]
+    return None
 
 def _as_bytes(b: BytesLike) -> bytes:
     return bytes(b) if not isinstance(b, bytes) else b
 
+def _as_buffer(b: BytesLike) -> BytesLike:
+    """bytes/bytearray/单字节连续 memoryview 原样返回（零拷贝），其余格式才拷贝成 bytes。"""
+    if isinstance(b, (bytes, bytearray)):
+        return b
+    if isinstance(b, memoryview) and b.format == "B" and b.c_contiguous:
+        return b
+    return bytes(b)
+
 def _pack_fixed_le_int_bool(value: Union[int, bool], size: int) -> bytes:
     """把 int/bool 按小端定长(1/2/4/…size)打包。"""
     if isinstance(value, bool):
@@ -26,19 +68,19 @@ def _pack_fixed_le_int_bool(value: Union[int, bool], size: int) -> bytes:
         iv = value
     else:
         raise TypeError("fixed-width variable expects int/bool")
-    if size not in (1, 2, 4):
+    iv &= (1 << (8 * size)) - 1
+    packer = _PACKERS.get(size)
+    if packer is None:
         # 兜底也可以支持其它 size
-        return int(iv & ((1 << (8 * size)) - 1)).to_bytes(size, "little")
-    if size == 1:
-        return bytes([iv & 0xFF])
-    if size == 2:
-        return (iv & 0xFFFF).to_bytes(2, "little")
-    if size == 4:
-        return (iv & 0xFFFFFFFF).to_bytes(4, "little")
-    raise AssertionError("unreachable")
-
-def _unpack_fixed_le_int(b: bytes) -> int:
-    return int.from_bytes(b, "little")
+        return iv.to_bytes(size, "little")
+    return packer(iv)
+
+def _unpack_fixed_le_int(b: BytesLike) -> int:
+    # unpack_from / from_bytes 均直接接受缓冲区，视图无需先拷贝成 bytes
+    unpacker = _UNPACKERS.get(len(b))
+    if unpacker is None:
+        return int.from_bytes(b, "little")
+    return unpacker(b)[0]
 
 def _pack_value_for_size(value: Union[int, bool, float, BytesLike], size: int) -> bytes:
     """
@@ -50,7 +92,7 @@ def _pack_value_for_size(value: Union[int, bool, float, BytesLike], size: int) -
     if isinstance(value, float):
         if size != 4:
             raise TypeError(f"float value only supported for 4-byte variables (got size={size})")
-        return struct.pack("<f", value)
+        return _PACK_F32(value)
     if isinstance(value, (bytes, bytearray, memoryview)):
         vbytes = _as_bytes(value)
         if len(vbytes) != size:
@@ -59,26 +101,57 @@ def _pack_value_for_size(value: Union[int, bool, float, BytesLike], size: int) -
     # int / bool
     return _pack_fixed_le_int_bool(value, size)
 
+def _make_fixed_packer(size: int) -> Callable[[Any], bytes]:
+    """为某一固定宽度生成专用打包函数：int/bool（及 4 字节的 float）直达，其余交给 _pack_value_for_size。"""
+    pack_int = _PACKERS.get(size)
+    if pack_int is None:
+        return lambda value: _pack_value_for_size(value, size)
+    mask = (1 << (8 * size)) - 1
+
+    def pack(value: Any) -> bytes:
+        tv = type(value)
+        if tv is int or tv is bool:
+            return pack_int(value & mask)
+        if tv is float and size == 4:
+            return _PACK_F32(value)
+        return _pack_value_for_size(value, size)
+    return pack
+
+# 按 T 字节下标的打包函数；可变长/未定义变量为 None
+_PACKER_BY_SIZE = {size: _make_fixed_packer(size) for size in set(_SIZE_BY_TAG) if size is not None}
+_PACKER_BY_TAG: Tuple[Optional[Callable[[Any], bytes]], ...] = tuple(
+    _PACKER_BY_SIZE[size] if size is not None else None for size in _SIZE_BY_TAG
+)
+
+def _make_fixed_unpacker(size: int) -> Callable[[BytesLike], Tuple[int]]:
+    def unpack(b: BytesLike) -> Tuple[int]:
+        return (int.from_bytes(b, "little"),)
+    return unpack
+
+# 按 T 字节下标的 unpack_from：F32 变量为 <f，其余按宽度取无符号小端；可变长/未定义为 None
+_UNPACK_BY_TAG: Tuple[Optional[Callable[[BytesLike], tuple]], ...] = tuple(
+    None if size is None
+    else _F32 if _IS_F32[i]
+    else _UNPACKERS.get(size) or _make_fixed_unpacker(size)
+    for i, size in enumerate(_SIZE_BY_TAG)
+)
+
 def _as_float32_le(b: BytesLike) -> float:
-    bb = _as_bytes(b)
+    bb = _as_buffer(b)
     if len(bb) != 4:
         raise ValueError(f"expect 4 bytes for float32, got {len(bb)}")
-    return struct.unpack("<f", bb)[0]
+    return _F32(bb)[0]
 
 # ===============================
 # 数据结构
 # ===============================
-@dataclass(frozen=True)
-class TLV:
+class TLV(NamedTuple):
     t: Union[Var, int]
     v: bytes
 
-    def __iter__(self):
-        yield self.t
-        yield self.v
+_new_tuple = tuple.__new__
 
-@dataclass(frozen=True)
-class DataPacket:
+class DataPacket(NamedTuple):
     msg: Union[Msg, int]
     ver: int
     tlvs: List[TLV]
@@ -86,18 +159,27 @@ class DataPacket:
 # ===============================
 # TLV 编码/解码（无状态）
 # ===============================
+def _encode_tlv_into(out: bytearray, t: VarId, value: BytesLike) -> None:
+    """校验并把一项 TLV 直接追加到 out 末尾，不产生中间 bytes。"""
+    t_val = int(t)
+    if not (0 <= t_val <= 0xFF):
+        raise ValueError("T must be 0..255")
+    vbytes = _as_bytes(value)
+    l = len(vbytes)
+    if l > 0xFF:
+        raise ValueError("TLV value too long (>255)")
+    out.append(t_val)
+    out.append(l)
+    out += vbytes
+
 class TLVEncoder:
     """TLV 项编码（宽容未知 T，长度 0..255）。"""
 
     @staticmethod
     def encode_tlv(t: VarId, value: BytesLike) -> bytes:
-        t_val = int(t) if isinstance(t, Var) else int(t)
-        if not (0 <= t_val <= 0xFF):
-            raise ValueError("T must be 0..255")
-        vbytes = _as_bytes(value)
-        if len(vbytes) > 0xFF:
-            raise ValueError("TLV value too long (>255)")
-        return bytes((t_val, len(vbytes))) + vbytes
+        out = bytearray()
+        _encode_tlv_into(out, t, value)
+        return bytes(out)
 
 class TLVDecoder:
     """TLV 字节流解码为 TLV 列表（未知 T 返回原始整数）。"""
@@ -106,75 +188,186 @@ class TLVDecoder:
     def decode_tlvs(data: BytesLike) -> List[TLV]:
         b = _as_bytes(data)
         res: List[TLV] = []
+        append = res.append
+        get = VAR_BY_ID.get
         i, n = 0, len(b)
         while i < n:
             if i + 2 > n:
                 raise ValueError("invalid TLV header")
             t_raw = b[i]
-            l = b[i + 1]
-            end = i + 2 + l
+            end = i + 2 + b[i + 1]
+            if end > n:
+                raise ValueError("invalid TLV length")
+            # 未知变量保留原值；tuple.__new__ 跳过 NamedTuple 的 Python 层 __new__
+            append(_new_tuple(TLV, (get(t_raw, t_raw), b[i + 2 : end])))
+            i = end
+        return res
+
+    @staticmethod
+    def decode_tlvs_view(data: BytesLike) -> List[TLV]:
+        """
+        同 decode_tlvs，但每项 V 为共享底层缓冲的只读 memoryview 切片（零拷贝）。
+        视图依赖 data 的生命周期；需长期保存时自行 bytes(v)。
+        """
+        mv = memoryview(_as_buffer(data)).toreadonly()
+        res: List[TLV] = []
+        append = res.append
+        get = VAR_BY_ID.get
+        i, n = 0, len(mv)
+        while i < n:
+            if i + 2 > n:
+                raise ValueError("invalid TLV header")
+            t_raw = mv[i]
+            end = i + 2 + mv[i + 1]
             if end > n:
                 raise ValueError("invalid TLV length")
-            v = b[i + 2 : end]
-            try:
-                t_val: Union[Var, int] = Var(t_raw)
-            except ValueError:
-                t_val = t_raw  # 未知变量，保留原值
-            res.append(TLV(t_val, v))
+            append(_new_tuple(TLV, (get(t_raw, t_raw), mv[i + 2 : end])))
             i = end
         return res
 
 # ===============================
 # DATA (MSG|VER|TLVs...) 编解码
 # ===============================
+_INT_CODE = {1: "B", 2: "H", 4: "I"}
+
+@lru_cache(maxsize=64)
+def _kv_layout(keys: Tuple[int, ...]) -> Optional[Callable[[Iterable[Any], int, int], Optional[bytes]]]:
+    """
+    按变量集合生成整包编码函数：'<BB' + 每项 'BB'+值格式（F32 变量用 'f'，其余按宽度无符号）预编译成
+    一个 Struct，再用 exec 生成对应的专用函数——T/L 与掩码作为常量内联、类型检查逐项展开，
+    运行时不再遍历布局描述。含可变长/非 1/2/4 宽度变量时返回 None。
+    控制端每拍发送的变量集合通常固定，函数只需生成一次。
+    生成的函数签名为 f(values, m, v)，值类型与布局不符时返回 None。
+    """
+    fmt = ["<BB"]
+    checks: List[str] = []
+    args = ["m", "v"]
+    for i, t_id in enumerate(keys):
+        size = fixed_size(t_id)
+        code = _INT_CODE.get(size)
+        if code is None:
+            return None
+        if size == 4 and _IS_F32[t_id]:
+            fmt.append("BBf")
+            checks.append(f"    if type(a{i}) is not float: return None")
+            args += (str(t_id), str(size), f"a{i}")
+        else:
+            fmt.append("BB" + code)
+            checks.append(f"    t = type(a{i})\n    if t is not int and t is not bool: return None")
+            args += (str(t_id), str(size), f"a{i} & {(1 << (8 * size)) - 1}")
+    names = "".join(f"a{i}, " for i in range(len(keys)))
+    src = "\n".join([
+        "def _encode(values, m, v):",
+        f"    ({names}) = values",
+        *checks,
+        f"    return _pack({', '.join(args)})",
+    ])
+    ns: Dict[str, Any] = {"_pack": struct.Struct("".join(fmt)).pack}
+    exec(src, ns)
+    return ns["_encode"]
+
+def _var_id(t: VarKey) -> int:
+    """
+    键统一取整（快速路径与通用路径共用）：Var/int 原样取整；
+    str 先按 YAML 变量名经 KEY_TO_VAR 反查，不是变量名时按十进制 ID 字符串解析（兼容旧用法，如 "16"）。
+    """
+    if type(t) is str:
+        var = KEY_TO_VAR.get(t)
+        if var is not None:
+            return int(var)
+        try:
+            return int(t)
+        except ValueError:
+            raise KeyError(f"unknown variable key {t!r}") from None
+    return int(t)
+
+def _encode_kv_fixed(kv: Dict[VarKey, Any], m: int, v: int) -> Optional[bytes]:
+    """
+    整包一次 pack 的快速路径；只处理“F32 变量给 float、其余固定宽度变量给 int/bool”的情形，
+    其它情况（bytes 值、类型不符、可变长变量）返回 None，由通用逐项路径处理，语义不变。
+    """
+    keys = tuple(map(_var_id, kv))
+    encode = _kv_layout(keys)
+    if encode is None:
+        return None
+    return encode(kv.values(), m, v)
+
 class DataEncoder:
     """打包 DATA：MSG(1) | VER(1) | TLVs...。不做流式。"""
 
     def __init__(self, *, default_msg: Union[Msg, int] = Msg.PC_TO_MCU, default_ver: int = PROTOCOL_DATA_VER):
-        self.default_msg = int(default_msg) if isinstance(default_msg, Msg) else _u8(int(default_msg))
-        self.default_ver = _u8(default_ver)
+        self.default_msg = int(default_msg) if isinstance(default_msg, Msg) else int(default_msg) & 0xFF
+        self.default_ver = default_ver & 0xFF
 
     def encode(self, tlvs: Iterable[Tuple[VarId, BytesLike]] | Iterable[TLV],
                *, msg: Union[Msg, int] | None = None, ver: int | None = None) -> bytes:
-        m = self.default_msg if msg is None else (int(msg) if isinstance(msg, Msg) else _u8(int(msg)))
-        v = self.default_ver if ver is None else _u8(ver)
+        m = self.default_msg if msg is None else (int(msg) if isinstance(msg, Msg) else int(msg) & 0xFF)
+        v = self.default_ver if ver is None else ver & 0xFF
+
+        out = bytearray((m, v))
+        for t, vb in tlvs:  # TLV 或 Tuple[VarId, BytesLike]
+            _encode_tlv_into(out, t, vb)
+        return bytes(out)
+
+    def encode_packed(self, tids: BytesLike, lens: BytesLike, values: BytesLike,
+                      *, msg: Union[Msg, int] | None = None, ver: int | None = None) -> bytes:
+        """
+        按三段并列缓冲编码：tids[i]/lens[i] 为第 i 项的 T/L，values 为各项 V 依次拼接。
+        三者可为 bytes/bytearray/array.array('B')；形状固定的报文可一次建好缓冲、每拍只改 values，
+        省去逐项 (T, bytes) 元组与小 bytes 的分配。不做按变量类型的宽度校验（同 encode）。
+        """
+        m = self.default_msg if msg is None else (int(msg) if isinstance(msg, Msg) else int(msg) & 0xFF)
+        v = self.default_ver if ver is None else ver & 0xFF
+
+        if len(tids) != len(lens):
+            raise ValueError(f"tids/lens length mismatch: {len(tids)} != {len(lens)}")
+        mv = memoryview(values).cast("B")
+        if sum(lens) != len(mv):
+            raise ValueError(f"values length {len(mv)} does not match sum(lens) {sum(lens)}")
 
         out = bytearray((m, v))
-        for item in tlvs:
-            if isinstance(item, TLV):
-                t, vb = item.t, item.v
-                out.extend(TLVEncoder.encode_tlv(t, vb))
-            else:
-                t, vb = item  # Tuple[VarId, BytesLike]
-                out.extend(TLVEncoder.encode_tlv(t, vb))
+        off = 0
+        for t, l in zip(tids, lens):
+            out.append(t)
+            out.append(l)
+            out += mv[off:off + l]
+            off += l
         return bytes(out)
 
     # 便捷：按 {变量: Python值} 直接编码（支持 float32）
-    def encode_kv(self, kv: Dict[VarId, Union[int, bool, float, BytesLike]],
+    def encode_kv(self, kv: Dict[VarKey, Union[int, bool, float, BytesLike]],
                   *, msg: Union[Msg, int] | None = None, ver: int | None = None) -> bytes:
-        tlv_bytes = bytearray()
+        m = self.default_msg if msg is None else (int(msg) if isinstance(msg, Msg) else int(msg) & 0xFF)
+        v = self.default_ver if ver is None else ver & 0xFF
+
+        # 变量集合固定且全为定长数值时整包一次 pack
+        packed = _encode_kv_fixed(kv, m, v)
+        if packed is not None:
+            return packed
+
+        # 通用路径：MSG|VER 在前，TLV 逐项直接追加到同一缓冲区
+        out = bytearray((m, v))
 
         for t, value in kv.items():
-            t_id = int(t) if isinstance(t, Var) else int(t)
+            t_id = _var_id(t)
 
-            meta = VAR_META.get(t_id)
-            size = VAR_FIXED_SIZE.get(t_id)
+            packer = _PACKER_BY_TAG[t_id] if 0 <= t_id <= 0xFF else None
 
-            if size is None:
-                # 变长：必须 bytes-like
+            if packer is None:
+                # 变长：必须 bytes-like，T/L 范围交给 _encode_tlv_into 校验
                 if not isinstance(value, (bytes, bytearray, memoryview)):
                     raise TypeError(f"variable 0x{t_id:02X} is variable-length; please provide bytes")
-                vbytes = _as_bytes(value)
-            else:
-                # 固定宽度：按 size 打包（保留你现有的小端+float32策略）
-                vbytes = _pack_value_for_size(value, size)
+                _encode_tlv_into(out, t_id, value)
+                continue
 
-            tlv_bytes.extend(TLVEncoder.encode_tlv(t_id, vbytes))
+            # 固定宽度：按 size 打包（保留你现有的小端+float32策略）；
+            # 定长变量的 T 必在 0..255、V 恰为 size 字节，直接写入
+            vbytes = packer(value)
+            out.append(t_id)
+            out.append(len(vbytes))
+            out += vbytes
 
-        # 拼接 MSG|VER|TLVs
-        m = self.default_msg if msg is None else (int(msg) if isinstance(msg, Msg) else _u8(int(msg)))
-        v = self.default_ver if ver is None else _u8(ver)
-        return bytes((m, v)) + bytes(tlv_bytes)
+        return bytes(out)
 
 class DataDecoder:
     """解析 DATA → DataPacket；提供将 TLV 的 V 还原成 Python 值的便捷函数。"""
@@ -185,10 +378,7 @@ class DataDecoder:
         if len(b) < 2:
             raise ValueError("DATA too short")
         msg_raw = b[0]
-        try:
-            msg: Union[Msg, int] = Msg(msg_raw)
-        except ValueError:
-            msg = msg_raw
+        msg: Union[Msg, int] = MSG_BY_ID.get(msg_raw, msg_raw)
         ver = b[1]
         tlvs = TLVDecoder.decode_tlvs(b[2:]) if len(b) > 2 else []
         return DataPacket(msg=msg, ver=ver, tlvs=tlvs)
@@ -201,23 +391,19 @@ class DataDecoder:
           - 固定宽度：
               * as_float=True 且 size==4 → 返回 float32（小端）
               * 否则返回 int（小端）
+        V 可为 decode_tlvs_view 给出的 memoryview，定长值直接从视图解包，不拷贝。
         """
-        t_id = int(t) if isinstance(t, Var) else int(t)
-        b = _as_bytes(v)
-        
-        meta = VAR_META.get(t_id)
-        size = VAR_FIXED_SIZE.get(t_id)
-        if size is None or meta is None:
-            return b
+        t_id = int(t)
+
+        size = _SIZE_BY_TAG[t_id] if 0 <= t_id <= 0xFF else None
+        if size is None:
+            # 可变长或未定义变量
+            return _as_bytes(v)
+        b = _as_buffer(v)
         if len(b) != size:
             raise ValueError(f"expect {size} bytes for var 0x{t_id:02X}, got {len(b)}")
-
-        vtype = (meta.get("vtype") or "").upper()
-        # 这里保留小端默认
-        if vtype in ("F32", "F32LE"):
-            return _as_float32_le(b)
-        # 其它按无符号小端整型还原（如需区分有符号/BE，可再细分）
-        return _unpack_fixed_le_int(b)
+        # 解包器已按变量类型预先选定（F32 → <f，其余按无符号小端整型），长度已校验
+        return _UNPACK_BY_TAG[t_id](b)[0]
 
     @staticmethod
     def value_as_float32(v: BytesLike) -> float:
@@ -228,26 +414,25 @@ class DataDecoder:
 # 薄门面（可选）：统一入口
 # ===============================
 class DataCodec:
-    """组合式门面：对外暴露 encode / decode / value_of。"""
-    __slots__ = ("enc", "dec")
+    """
+    组合式门面：对外暴露 encode / decode / value_of。
+    方法在构造时直接绑定为编/解码器的 bound method，调用不再经过一层转发。
+    """
+    __slots__ = ("enc", "dec", "encode", "encode_kv", "encode_packed", "decode", "value_of", "value_as_float32")
+
+    encode: Callable[..., bytes]
+    encode_kv: Callable[..., bytes]
+    encode_packed: Callable[..., bytes]
+    decode: Callable[[BytesLike], DataPacket]
+    value_of: Callable[[VarId, BytesLike], Union[int, float, bytes]]
+    value_as_float32: Callable[[BytesLike], float]
 
     def __init__(self, *, default_msg: Union[Msg, int] = Msg.PC_TO_MCU, default_ver: int = PROTOCOL_DATA_VER):
         self.enc = DataEncoder(default_msg=default_msg, default_ver=default_ver)
         self.dec = DataDecoder()
-
-    def encode(self, tlvs: Iterable[Tuple[VarId, BytesLike]] | Iterable[TLV],
-               *, msg: Union[Msg, int] | None = None, ver: int | None = None) -> bytes:
-        return self.enc.encode(tlvs, msg=msg, ver=ver)
-
-    def encode_kv(self, kv: Dict[VarId, Union[int, bool, float, BytesLike]],
-                  *, msg: Union[Msg, int] | None = None, ver: int | None = None) -> bytes:
-        return self.enc.encode_kv(kv, msg=msg, ver=ver)
-
-    def decode(self, data: BytesLike) -> DataPacket:
-        return self.dec.decode(data)
-
-    def value_of(self, t: VarId, v: BytesLike) -> Union[int, float, bytes]:
-        return self.dec.value_of(t, v)
-
-    def value_as_float32(self, v: BytesLike) -> float:
-        return self.dec.value_as_float32(v)
+        self.encode = self.enc.encode
+        self.encode_kv = self.enc.encode_kv
+        self.encode_packed = self.enc.encode_packed
+        self.decode = self.dec.decode
+        self.value_of = self.dec.value_of
+        self.value_as_float32 = self.dec.value_as_float32
@@ -1,14 +1,17 @@
 # Auto-generated. DO NOT EDIT MANUALLY.
-# Generated at UTC 2025-09-27 03:48:44
+# CONTENT_HASH: 8ead682ee4b7f0c3
+# Generated at UTC 2026-10-16 10:56:11
 # Version policy:
-#   PROTOCOL_DATA_VER_FULL = YYYYMMDDHHMMSS (UTC)
+#   PROTOCOL_DATA_VER_FULL = blake2b-64(sorted NAME:VTYPE:ID)
 #   PROTOCOL_DATA_VER      = PROTOCOL_DATA_VER_FULL & 0xFF  # 1-byte for DATA header
 
+import sys
 from enum import IntEnum
-from typing import Dict, Optional, TypedDict
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
 
-PROTOCOL_DATA_VER_FULL: int = 20250927034844
-PROTOCOL_DATA_VER: int = 0xDC
+PROTOCOL_DATA_VER_FULL: int = 2052627596838202747
+PROTOCOL_DATA_VER: int = 0x7B
 
 class Msg(IntEnum):
     PC_TO_MCU = 0x01
@@ -65,115 +68,267 @@ class Var(IntEnum):
     TEST_VAR_U16 = 0xE6  # U16
     ARM_STORE_TO_RESET = 0xEB  # BOOL
 
-class VarMeta(TypedDict, total=False):
+# ID → 枚举成员；未知 ID 用 .get(x, x) 保留原始整数
+VAR_BY_ID: Dict[int, Var] = {int(v): v for v in Var}
+MSG_BY_ID: Dict[int, Msg] = {int(m): m for m in Msg}
+
+# 纯 int 别名：热路径比较/作 dict 键时用，省去 IntEnum 成员的类属性查找（约 0.1 us/次）
+M_PC_TO_MCU = 0x01
+M_MCU_TO_PC = 0x02
+V_FRICTION_WHEEL_SPEED = 0x01
+V_ARM_SHOT_TO_RESET = 0x10
+V_IMU_RESET = 0x13
+V_TEST_VAR_U8 = 0x1C
+V_ARM_RESET_TO_STORE = 0x1F
+V_BASE_MOVE_BACKWARD_FAST = 0x21
+V_BASE_MOVE_FORWARD_FAST_EX = 0x29
+V_ARM_RESET_TO_HIGH_PREPARE = 0x2E
+V_ARM_HIGH_GRIP_TO_SHOT = 0x34
+V_BASE_ROTATE_CW_FAST = 0x36
+V_ARM_STORE_TO_SHOT = 0x37
+V_FIRE_ONCE = 0x41
+V_ARM_RESET = 0x4B
+V_ARM_LOW_GRIP_TO_WAIT_SHOT = 0x4C
+V_ARM_LOW_PREPARE_TO_GRIP = 0x53
+V_BASE_MOVE_FORWARD_FAST = 0x5B
+V_BASE_ROTATE_CW_SLOW = 0x5D
+V_ARM_HIGH_PREPARE_TO_GRIP = 0x65
+V_IMU_YAW = 0x67
+V_ARM_RELAX = 0x72
+V_ARM_LOW_GRIP_TO_STORE = 0x77
+V_BASE_STOP = 0x7B
+V_BASE_ROTATE_CCW_FAST = 0x83
+V_TEST_VAR_F32 = 0x88
+V_BASE_MOVE_FORWARD_SLOW = 0x8C
+V_ERROR = 0x93
+V_BASE_ROTATE_CCW_SLOW = 0x94
+V_BASE_MOVE_BACKWARD_SLOW = 0x99
+V_BASE_MOVE_LEFT_SLOW = 0x9A
+V_OK = 0x9D
+V_ARM_HIGH_GRIP_TO_WAIT_SHOT = 0x9E
+V_BASE_MOVE_BACKWARD_FAST_EX = 0x9F
+V_GET_IMU_YAW = 0xA3
+V_GET_VOLTAGE = 0xA4
+V_FRICTION_WHEEL_STOP = 0xA6
+V_ARM_WAIT_SHOT_TO_SHOT = 0xAB
+V_VOLTAGE = 0xBB
+V_ARM_HIGH_GRIP_TO_STORE = 0xBD
+V_BASE_MOVE_LEFT_FAST = 0xC5
+V_BASE_MOVE_RIGHT_SLOW = 0xC9
+V_BASE_MOVE_RIGHT_FAST = 0xCA
+V_DART_PUSH_ONCE = 0xCD
+V_HEARTBEAT = 0xD1
+V_ARM_LOW_GRIP_TO_SHOT = 0xD6
+V_ARM_RESET_TO_LOW_PREPARE = 0xD8
+V_FRICTION_WHEEL_START = 0xDE
+V_TURRET_ANGLE_YAW = 0xE1
+V_TEST_VAR_U16 = 0xE6
+V_ARM_STORE_TO_RESET = 0xEB
+
+class VarMeta(NamedTuple):
     key: str       # 原始键（YAML 中的 name，用于 UI/业务）
-    vtype: str     # 变量类型字符串（如 U16LE/F32/…）
+    vtype: str     # 变量类型字符串（如 U16LE/F32/…）；类型码见 VAR_VTYPE_TBL
     size: Optional[int]  # 固定长度；可变长(BYTES/STR/…)为 None
 
-VAR_META: Dict[int, VarMeta] = {
-    int(Var.FRICTION_WHEEL_SPEED): {"key": "friction_wheel_speed", "vtype": "F32", "size": 4},
-    int(Var.ARM_SHOT_TO_RESET): {"key": "arm_shot_to_reset", "vtype": "BOOL", "size": 1},
-    int(Var.IMU_RESET): {"key": "imu_reset", "vtype": "BOOL", "size": 1},
-    int(Var.TEST_VAR_U8): {"key": "test_var_u8", "vtype": "U8", "size": 1},
-    int(Var.ARM_RESET_TO_STORE): {"key": "arm_reset_to_store", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_BACKWARD_FAST): {"key": "base_move_backward_fast", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_FORWARD_FAST_EX): {"key": "base_move_forward_fast_ex", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_RESET_TO_HIGH_PREPARE): {"key": "arm_reset_to_high_prepare", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_HIGH_GRIP_TO_SHOT): {"key": "arm_high_grip_to_shot", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_ROTATE_CW_FAST): {"key": "base_rotate_CW_fast", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_STORE_TO_SHOT): {"key": "arm_store_to_shot", "vtype": "BOOL", "size": 1},
-    int(Var.FIRE_ONCE): {"key": "fire_once", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_RESET): {"key": "arm_reset", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_LOW_GRIP_TO_WAIT_SHOT): {"key": "arm_low_grip_to_wait_shot", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_LOW_PREPARE_TO_GRIP): {"key": "arm_low_prepare_to_grip", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_FORWARD_FAST): {"key": "base_move_forward_fast", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_ROTATE_CW_SLOW): {"key": "base_rotate_CW_slow", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_HIGH_PREPARE_TO_GRIP): {"key": "arm_high_prepare_to_grip", "vtype": "BOOL", "size": 1},
-    int(Var.IMU_YAW): {"key": "imu_yaw", "vtype": "F32", "size": 4},
-    int(Var.ARM_RELAX): {"key": "arm_relax", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_LOW_GRIP_TO_STORE): {"key": "arm_low_grip_to_store", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_STOP): {"key": "base_stop", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_ROTATE_CCW_FAST): {"key": "base_rotate_CCW_fast", "vtype": "BOOL", "size": 1},
-    int(Var.TEST_VAR_F32): {"key": "test_var_f32", "vtype": "F32", "size": 4},
-    int(Var.BASE_MOVE_FORWARD_SLOW): {"key": "base_move_forward_slow", "vtype": "BOOL", "size": 1},
-    int(Var.ERROR): {"key": "ERROR", "vtype": "U8", "size": 1},
-    int(Var.BASE_ROTATE_CCW_SLOW): {"key": "base_rotate_CCW_slow", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_BACKWARD_SLOW): {"key": "base_move_backward_slow", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_LEFT_SLOW): {"key": "base_move_left_slow", "vtype": "BOOL", "size": 1},
-    int(Var.OK): {"key": "OK", "vtype": "U8", "size": 1},
-    int(Var.ARM_HIGH_GRIP_TO_WAIT_SHOT): {"key": "arm_high_grip_to_wait_shot", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_BACKWARD_FAST_EX): {"key": "base_move_backward_fast_ex", "vtype": "BOOL", "size": 1},
-    int(Var.GET_IMU_YAW): {"key": "get_imu_yaw", "vtype": "BOOL", "size": 1},
-    int(Var.GET_VOLTAGE): {"key": "get_voltage", "vtype": "BOOL", "size": 1},
-    int(Var.FRICTION_WHEEL_STOP): {"key": "friction_wheel_stop", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_WAIT_SHOT_TO_SHOT): {"key": "arm_wait_shot_to_shot", "vtype": "BOOL", "size": 1},
-    int(Var.VOLTAGE): {"key": "voltage", "vtype": "F32", "size": 4},
-    int(Var.ARM_HIGH_GRIP_TO_STORE): {"key": "arm_high_grip_to_store", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_LEFT_FAST): {"key": "base_move_left_fast", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_RIGHT_SLOW): {"key": "base_move_right_slow", "vtype": "BOOL", "size": 1},
-    int(Var.BASE_MOVE_RIGHT_FAST): {"key": "base_move_right_fast", "vtype": "BOOL", "size": 1},
-    int(Var.DART_PUSH_ONCE): {"key": "dart_push_once", "vtype": "BOOL", "size": 1},
-    int(Var.HEARTBEAT): {"key": "HEARTBEAT", "vtype": "U8", "size": 1},
-    int(Var.ARM_LOW_GRIP_TO_SHOT): {"key": "arm_low_grip_to_shot", "vtype": "BOOL", "size": 1},
-    int(Var.ARM_RESET_TO_LOW_PREPARE): {"key": "arm_reset_to_low_prepare", "vtype": "BOOL", "size": 1},
-    int(Var.FRICTION_WHEEL_START): {"key": "friction_wheel_start", "vtype": "BOOL", "size": 1},
-    int(Var.TURRET_ANGLE_YAW): {"key": "turret_angle_yaw", "vtype": "F32", "size": 4},
-    int(Var.TEST_VAR_U16): {"key": "test_var_u16", "vtype": "U16", "size": 2},
-    int(Var.ARM_STORE_TO_RESET): {"key": "arm_store_to_reset", "vtype": "BOOL", "size": 1},
-}
+# 只读视图：外层映射不可修改，每项 VarMeta 本身为不可变元组
+VAR_META: Mapping[int, VarMeta] = MappingProxyType({
+    0x01: VarMeta("friction_wheel_speed", "F32", 4),  # Var.FRICTION_WHEEL_SPEED
+    0x10: VarMeta("arm_shot_to_reset", "BOOL", 1),  # Var.ARM_SHOT_TO_RESET
+    0x13: VarMeta("imu_reset", "BOOL", 1),  # Var.IMU_RESET
+    0x1C: VarMeta("test_var_u8", "U8", 1),  # Var.TEST_VAR_U8
+    0x1F: VarMeta("arm_reset_to_store", "BOOL", 1),  # Var.ARM_RESET_TO_STORE
+    0x21: VarMeta("base_move_backward_fast", "BOOL", 1),  # Var.BASE_MOVE_BACKWARD_FAST
+    0x29: VarMeta("base_move_forward_fast_ex", "BOOL", 1),  # Var.BASE_MOVE_FORWARD_FAST_EX
+    0x2E: VarMeta("arm_reset_to_high_prepare", "BOOL", 1),  # Var.ARM_RESET_TO_HIGH_PREPARE
+    0x34: VarMeta("arm_high_grip_to_shot", "BOOL", 1),  # Var.ARM_HIGH_GRIP_TO_SHOT
+    0x36: VarMeta("base_rotate_CW_fast", "BOOL", 1),  # Var.BASE_ROTATE_CW_FAST
+    0x37: VarMeta("arm_store_to_shot", "BOOL", 1),  # Var.ARM_STORE_TO_SHOT
+    0x41: VarMeta("fire_once", "BOOL", 1),  # Var.FIRE_ONCE
+    0x4B: VarMeta("arm_reset", "BOOL", 1),  # Var.ARM_RESET
+    0x4C: VarMeta("arm_low_grip_to_wait_shot", "BOOL", 1),  # Var.ARM_LOW_GRIP_TO_WAIT_SHOT
+    0x53: VarMeta("arm_low_prepare_to_grip", "BOOL", 1),  # Var.ARM_LOW_PREPARE_TO_GRIP
+    0x5B: VarMeta("base_move_forward_fast", "BOOL", 1),  # Var.BASE_MOVE_FORWARD_FAST
+    0x5D: VarMeta("base_rotate_CW_slow", "BOOL", 1),  # Var.BASE_ROTATE_CW_SLOW
+    0x65: VarMeta("arm_high_prepare_to_grip", "BOOL", 1),  # Var.ARM_HIGH_PREPARE_TO_GRIP
+    0x67: VarMeta("imu_yaw", "F32", 4),  # Var.IMU_YAW
+    0x72: VarMeta("arm_relax", "BOOL", 1),  # Var.ARM_RELAX
+    0x77: VarMeta("arm_low_grip_to_store", "BOOL", 1),  # Var.ARM_LOW_GRIP_TO_STORE
+    0x7B: VarMeta("base_stop", "BOOL", 1),  # Var.BASE_STOP
+    0x83: VarMeta("base_rotate_CCW_fast", "BOOL", 1),  # Var.BASE_ROTATE_CCW_FAST
+    0x88: VarMeta("test_var_f32", "F32", 4),  # Var.TEST_VAR_F32
+    0x8C: VarMeta("base_move_forward_slow", "BOOL", 1),  # Var.BASE_MOVE_FORWARD_SLOW
+    0x93: VarMeta("ERROR", "U8", 1),  # Var.ERROR
+    0x94: VarMeta("base_rotate_CCW_slow", "BOOL", 1),  # Var.BASE_ROTATE_CCW_SLOW
+    0x99: VarMeta("base_move_backward_slow", "BOOL", 1),  # Var.BASE_MOVE_BACKWARD_SLOW
+    0x9A: VarMeta("base_move_left_slow", "BOOL", 1),  # Var.BASE_MOVE_LEFT_SLOW
+    0x9D: VarMeta("OK", "U8", 1),  # Var.OK
+    0x9E: VarMeta("arm_high_grip_to_wait_shot", "BOOL", 1),  # Var.ARM_HIGH_GRIP_TO_WAIT_SHOT
+    0x9F: VarMeta("base_move_backward_fast_ex", "BOOL", 1),  # Var.BASE_MOVE_BACKWARD_FAST_EX
+    0xA3: VarMeta("get_imu_yaw", "BOOL", 1),  # Var.GET_IMU_YAW
+    0xA4: VarMeta("get_voltage", "BOOL", 1),  # Var.GET_VOLTAGE
+    0xA6: VarMeta("friction_wheel_stop", "BOOL", 1),  # Var.FRICTION_WHEEL_STOP
+    0xAB: VarMeta("arm_wait_shot_to_shot", "BOOL", 1),  # Var.ARM_WAIT_SHOT_TO_SHOT
+    0xBB: VarMeta("voltage", "F32", 4),  # Var.VOLTAGE
+    0xBD: VarMeta("arm_high_grip_to_store", "BOOL", 1),  # Var.ARM_HIGH_GRIP_TO_STORE
+    0xC5: VarMeta("base_move_left_fast", "BOOL", 1),  # Var.BASE_MOVE_LEFT_FAST
+    0xC9: VarMeta("base_move_right_slow", "BOOL", 1),  # Var.BASE_MOVE_RIGHT_SLOW
+    0xCA: VarMeta("base_move_right_fast", "BOOL", 1),  # Var.BASE_MOVE_RIGHT_FAST
+    0xCD: VarMeta("dart_push_once", "BOOL", 1),  # Var.DART_PUSH_ONCE
+    0xD1: VarMeta("HEARTBEAT", "U8", 1),  # Var.HEARTBEAT
+    0xD6: VarMeta("arm_low_grip_to_shot", "BOOL", 1),  # Var.ARM_LOW_GRIP_TO_SHOT
+    0xD8: VarMeta("arm_reset_to_low_prepare", "BOOL", 1),  # Var.ARM_RESET_TO_LOW_PREPARE
+    0xDE: VarMeta("friction_wheel_start", "BOOL", 1),  # Var.FRICTION_WHEEL_START
+    0xE1: VarMeta("turret_angle_yaw", "F32", 4),  # Var.TURRET_ANGLE_YAW
+    0xE6: VarMeta("test_var_u16", "U16", 2),  # Var.TEST_VAR_U16
+    0xEB: VarMeta("arm_store_to_reset", "BOOL", 1),  # Var.ARM_STORE_TO_RESET
+})
 
 VAR_FIXED_SIZE: Dict[int, int] = {
-    int(Var.FRICTION_WHEEL_SPEED): 4,
-    int(Var.ARM_SHOT_TO_RESET): 1,
-    int(Var.IMU_RESET): 1,
-    int(Var.TEST_VAR_U8): 1,
-    int(Var.ARM_RESET_TO_STORE): 1,
-    int(Var.BASE_MOVE_BACKWARD_FAST): 1,
-    int(Var.BASE_MOVE_FORWARD_FAST_EX): 1,
-    int(Var.ARM_RESET_TO_HIGH_PREPARE): 1,
-    int(Var.ARM_HIGH_GRIP_TO_SHOT): 1,
-    int(Var.BASE_ROTATE_CW_FAST): 1,
-    int(Var.ARM_STORE_TO_SHOT): 1,
-    int(Var.FIRE_ONCE): 1,
-    int(Var.ARM_RESET): 1,
-    int(Var.ARM_LOW_GRIP_TO_WAIT_SHOT): 1,
-    int(Var.ARM_LOW_PREPARE_TO_GRIP): 1,
-    int(Var.BASE_MOVE_FORWARD_FAST): 1,
-    int(Var.BASE_ROTATE_CW_SLOW): 1,
-    int(Var.ARM_HIGH_PREPARE_TO_GRIP): 1,
-    int(Var.IMU_YAW): 4,
-    int(Var.ARM_RELAX): 1,
-    int(Var.ARM_LOW_GRIP_TO_STORE): 1,
-    int(Var.BASE_STOP): 1,
-    int(Var.BASE_ROTATE_CCW_FAST): 1,
-    int(Var.TEST_VAR_F32): 4,
-    int(Var.BASE_MOVE_FORWARD_SLOW): 1,
-    int(Var.ERROR): 1,
-    int(Var.BASE_ROTATE_CCW_SLOW): 1,
-    int(Var.BASE_MOVE_BACKWARD_SLOW): 1,
-    int(Var.BASE_MOVE_LEFT_SLOW): 1,
-    int(Var.OK): 1,
-    int(Var.ARM_HIGH_GRIP_TO_WAIT_SHOT): 1,
-    int(Var.BASE_MOVE_BACKWARD_FAST_EX): 1,
-    int(Var.GET_IMU_YAW): 1,
-    int(Var.GET_VOLTAGE): 1,
-    int(Var.FRICTION_WHEEL_STOP): 1,
-    int(Var.ARM_WAIT_SHOT_TO_SHOT): 1,
-    int(Var.VOLTAGE): 4,
-    int(Var.ARM_HIGH_GRIP_TO_STORE): 1,
-    int(Var.BASE_MOVE_LEFT_FAST): 1,
-    int(Var.BASE_MOVE_RIGHT_SLOW): 1,
-    int(Var.BASE_MOVE_RIGHT_FAST): 1,
-    int(Var.DART_PUSH_ONCE): 1,
-    int(Var.HEARTBEAT): 1,
-    int(Var.ARM_LOW_GRIP_TO_SHOT): 1,
-    int(Var.ARM_RESET_TO_LOW_PREPARE): 1,
-    int(Var.FRICTION_WHEEL_START): 1,
-    int(Var.TURRET_ANGLE_YAW): 4,
-    int(Var.TEST_VAR_U16): 2,
-    int(Var.ARM_STORE_TO_RESET): 1,
+    0x01: 4,  # Var.FRICTION_WHEEL_SPEED
+    0x10: 1,  # Var.ARM_SHOT_TO_RESET
+    0x13: 1,  # Var.IMU_RESET
+    0x1C: 1,  # Var.TEST_VAR_U8
+    0x1F: 1,  # Var.ARM_RESET_TO_STORE
+    0x21: 1,  # Var.BASE_MOVE_BACKWARD_FAST
+    0x29: 1,  # Var.BASE_MOVE_FORWARD_FAST_EX
+    0x2E: 1,  # Var.ARM_RESET_TO_HIGH_PREPARE
+    0x34: 1,  # Var.ARM_HIGH_GRIP_TO_SHOT
+    0x36: 1,  # Var.BASE_ROTATE_CW_FAST
+    0x37: 1,  # Var.ARM_STORE_TO_SHOT
+    0x41: 1,  # Var.FIRE_ONCE
+    0x4B: 1,  # Var.ARM_RESET
+    0x4C: 1,  # Var.ARM_LOW_GRIP_TO_WAIT_SHOT
+    0x53: 1,  # Var.ARM_LOW_PREPARE_TO_GRIP
+    0x5B: 1,  # Var.BASE_MOVE_FORWARD_FAST
+    0x5D: 1,  # Var.BASE_ROTATE_CW_SLOW
+    0x65: 1,  # Var.ARM_HIGH_PREPARE_TO_GRIP
+    0x67: 4,  # Var.IMU_YAW
+    0x72: 1,  # Var.ARM_RELAX
+    0x77: 1,  # Var.ARM_LOW_GRIP_TO_STORE
+    0x7B: 1,  # Var.BASE_STOP
+    0x83: 1,  # Var.BASE_ROTATE_CCW_FAST
+    0x88: 4,  # Var.TEST_VAR_F32
+    0x8C: 1,  # Var.BASE_MOVE_FORWARD_SLOW
+    0x93: 1,  # Var.ERROR
+    0x94: 1,  # Var.BASE_ROTATE_CCW_SLOW
+    0x99: 1,  # Var.BASE_MOVE_BACKWARD_SLOW
+    0x9A: 1,  # Var.BASE_MOVE_LEFT_SLOW
+    0x9D: 1,  # Var.OK
+    0x9E: 1,  # Var.ARM_HIGH_GRIP_TO_WAIT_SHOT
+    0x9F: 1,  # Var.BASE_MOVE_BACKWARD_FAST_EX
+    0xA3: 1,  # Var.GET_IMU_YAW
+    0xA4: 1,  # Var.GET_VOLTAGE
+    0xA6: 1,  # Var.FRICTION_WHEEL_STOP
+    0xAB: 1,  # Var.ARM_WAIT_SHOT_TO_SHOT
+    0xBB: 4,  # Var.VOLTAGE
+    0xBD: 1,  # Var.ARM_HIGH_GRIP_TO_STORE
+    0xC5: 1,  # Var.BASE_MOVE_LEFT_FAST
+    0xC9: 1,  # Var.BASE_MOVE_RIGHT_SLOW
+    0xCA: 1,  # Var.BASE_MOVE_RIGHT_FAST
+    0xCD: 1,  # Var.DART_PUSH_ONCE
+    0xD1: 1,  # Var.HEARTBEAT
+    0xD6: 1,  # Var.ARM_LOW_GRIP_TO_SHOT
+    0xD8: 1,  # Var.ARM_RESET_TO_LOW_PREPARE
+    0xDE: 1,  # Var.FRICTION_WHEEL_START
+    0xE1: 4,  # Var.TURRET_ANGLE_YAW
+    0xE6: 2,  # Var.TEST_VAR_U16
+    0xEB: 1,  # Var.ARM_STORE_TO_RESET
 }
 
+# ID → key 的 256 项元组（驻留字符串；未定义为 None），UI/日志取名时直接下标
+VAR_KEY_TBL: Tuple[Optional[str], ...] = tuple(
+    sys.intern(VAR_META[i].key) if i in VAR_META else None for i in range(256)
+)
+
+def key_of(vid: int) -> Optional[str]:
+    """按 ID（0..255）取变量的 key；未定义的 ID 返回 None。"""
+    return VAR_KEY_TBL[vid]
+
+# key → 枚举成员（反查表），按 YAML 变量名编码时一次 dict 查找
+KEY_TO_VAR: Dict[str, Var] = {meta.key: VAR_BY_ID[vid] for vid, meta in VAR_META.items()}
+
+# 256 项尺寸查表（下标为 ID；0 表示可变长/未定义，与 C 端 VAR_SIZE_TABLE 一致）
+VAR_SIZE_TABLE: bytes = bytes((
+    0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  # 0x00
+    1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1,  # 0x10
+    0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0,  # 0x20
+    0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0,  # 0x30
+    0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0,  # 0x40
+    0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0,  # 0x50
+    0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0,  # 0x60
+    0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0,  # 0x70
+    0, 0, 0, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0,  # 0x80
+    0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1,  # 0x90
+    0, 0, 0, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0,  # 0xA0
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 1, 0, 0,  # 0xB0
+    0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 0, 0, 1, 0, 0,  # 0xC0
+    0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0,  # 0xD0
+    0, 4, 0, 0, 0, 0, 2, 0, 0, 0, 0, 1, 0, 0, 0, 0,  # 0xE0
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  # 0xF0
+))
+
+class VType(IntEnum):
+    UNKNOWN = 0
+    U8 = 1
+    I8 = 2
+    BOOL = 3
+    U16LE = 4
+    I16LE = 5
+    U16BE = 6
+    I16BE = 7
+    U32LE = 8
+    I32LE = 9
+    U32BE = 10
+    I32BE = 11
+    F32LE = 12
+    F32BE = 13
+    BYTES = 14
+    STR = 15
+    BYTE = 1
+    U16 = 4
+    I16 = 5
+    U32 = 8
+    I32 = 9
+    F32 = 12
+    STRING = 15
+    UTF8 = 15
+    ASCII = 15
+
+# 256 项类型码查表（下标为 ID；值为 VType，0 表示未定义），解码分派时代替 vtype 字符串比较
+VAR_VTYPE_TBL: bytes = bytes((
+    0, 12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  # 0x00
+    3, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 3,  # 0x10
+    0, 3, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 3, 0,  # 0x20
+    0, 0, 0, 0, 3, 0, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0,  # 0x30
+    0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0,  # 0x40
+    0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 3, 0, 3, 0, 0,  # 0x50
+    0, 0, 0, 0, 0, 3, 0, 12, 0, 0, 0, 0, 0, 0, 0, 0,  # 0x60
+    0, 0, 3, 0, 0, 0, 0, 3, 0, 0, 0, 3, 0, 0, 0, 0,  # 0x70
+    0, 0, 0, 3, 0, 0, 0, 0, 12, 0, 0, 0, 3, 0, 0, 0,  # 0x80
+    0, 0, 0, 1, 3, 0, 0, 0, 0, 3, 3, 0, 0, 1, 3, 3,  # 0x90
+    0, 0, 0, 3, 3, 0, 3, 0, 0, 0, 0, 3, 0, 0, 0, 0,  # 0xA0
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 0, 3, 0, 0,  # 0xB0
+    0, 0, 0, 0, 0, 3, 0, 0, 0, 3, 3, 0, 0, 3, 0, 0,  # 0xC0
+    0, 1, 0, 0, 0, 0, 3, 0, 3, 0, 0, 0, 0, 0, 3, 0,  # 0xD0
+    0, 12, 0, 0, 0, 0, 4, 0, 0, 0, 0, 3, 0, 0, 0, 0,  # 0xE0
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  # 0xF0
+))
+
+# 查表挂到 Var 类上，与枚举同生命周期；只拿到 Var 类的调用方一次属性访问即可下标
+Var.__fixed_size__ = VAR_SIZE_TABLE
+Var.__vtype__ = VAR_VTYPE_TBL
+
+# 码值 → 规范 VType 成员（别名不单独占位）
+_VTYPE_BY_CODE: Tuple[VType, ...] = tuple(VType(c) for c in range(max(VType) + 1))
+
+def size_of(vid: int) -> int:
+    """按 ID（0..255）取固定字节数；可变长/未定义为 0。"""
+    return VAR_SIZE_TABLE[vid]
+
+def vtype_of(vid: int) -> VType:
+    """按 ID（0..255）取规范 VType；未定义为 VType.UNKNOWN。"""
+    return _VTYPE_BY_CODE[VAR_VTYPE_TBL[vid]]
+
 # 说明：
 # - BYTES/STR 等可变长类型不在 VAR_FIXED_SIZE 中；按 TLV 的 L 解析。
 # - 编解码逻辑由其他模块实现；此文件仅提供 ID/类型/长度元信息。
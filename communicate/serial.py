@@ -1,21 +1,27 @@
-from typing import Optional, Callable, Union
+from typing import List, Optional, Callable, Union
 from dataclasses import dataclass
+import os
+import select
+import socket
 import threading
 import time
 import serial
 
+
 @dataclass
 class SerialConfig:
     port: str = ''
     baudrate: int = 115200
     chunk_size: int = 64  # 减小chunk_size，提高响应速度
+    rt_priority: int = 0  # >0 时 RX 线程以 SCHED_FIFO 该优先级运行（Linux，需 CAP_SYS_NICE）；0 为不启用
+    rx_cpu: int = -1      # >=0 时把 RX 线程绑定到该 CPU 核（Linux）；-1 为不绑定
 
 class SyncSerial:
     """
     同步串口（基于 PySerial）
     - set_recv_callback(cb): 每次收到一块 bytes 就回调一次
     - start_receiving()/stop_receiving(): 以后台线程阻塞读取
-    - send(data): 同步发送原始 bytes
+    - send(data, flush=False): 同步发送原始 bytes；flush=True 时等待发送缓冲排空
     """
     def __init__(self, config: SerialConfig = SerialConfig()):
         self.cfg = config
@@ -24,6 +30,10 @@ class SyncSerial:
 
         self._rx_thread: Optional[threading.Thread] = None
         self._rx_stop_flag = threading.Event()
+        # 自唤醒管道：stop_receiving 写入 1 字节，POSIX 下 RX 线程的 select 立即返回，无需超时轮询。
+        # start_receiving 时按需创建，close() 时释放
+        self._wakeup_r: Optional[socket.socket] = None
+        self._wakeup_w: Optional[socket.socket] = None
 
         # 保护串口对象的锁（写/关）
         self._lock = threading.Lock()
@@ -45,7 +55,7 @@ class SyncSerial:
             return False
 
     def close(self) -> None:
-        """停止接收线程并关闭串口。"""
+        """停止接收线程、关闭串口并释放自唤醒管道。"""
         self.stop_receiving()
         with self._lock:
             if self._ser is not None:
@@ -54,17 +64,76 @@ class SyncSerial:
                 except Exception:
                     pass
                 self._ser = None
+        for sock in (self._wakeup_r, self._wakeup_w):
+            if sock is not None:
+                sock.close()
+        self._wakeup_r = self._wakeup_w = None
 
     # ---------- 发送 ----------
-    def send(self, data: Union[bytes, bytearray, memoryview]) -> None:
-        """同步发送原始字节；仅接受 bytes/bytearray/memoryview。"""
+    def send(self, data: Union[bytes, bytearray, memoryview], *, flush: bool = False) -> None:
+        """
+        同步发送原始字节；仅接受 bytes/bytearray/memoryview。
+        数据原样交给 PySerial（其 write 接受 bytes-like），不再预先 bytes() 拷贝；
+        write 返回即已进入内核发送缓冲。flush=True 时再等待缓冲排空（tcdrain），
+        仅在确需“已发出”语义时使用，否则每次发送都会被串行化到线速。
+        """
         if not isinstance(data, (bytes, bytearray, memoryview)):
             raise TypeError("send() 仅接受 bytes/bytearray/memoryview")
         with self._lock:
             if self._ser is None or not self._ser.is_open:
                 raise RuntimeError("串口未打开，请先调用 open()")
-            self._ser.write(bytes(data))
-            self._ser.flush()  # 可选：确保尽快刷出
+            self._ser.write(data)
+            if flush:
+                self._ser.flush()
+
+    def send_iov(self, bufs: List[Union[bytes, bytearray, memoryview]], *, flush: bool = False) -> None:
+        """
+        聚集发送：把若干分段（如帧头、DATA、帧尾）经一次 os.writev 交给内核，省去拼接整帧的拷贝。
+        非 POSIX（Windows 上 PySerial 无聚集写路径）或取不到 fd 时退回拼接后单次 write。
+        与 PySerial 的 write 一致：fd 为非阻塞，写不完时等待可写，超过 write_timeout 抛 SerialTimeoutException。
+        """
+        with self._lock:
+            ser = self._ser
+            if ser is None or not ser.is_open:
+                raise RuntimeError("串口未打开，请先调用 open()")
+            fd = self._rx_fd(ser)
+            if fd is None or not hasattr(os, "writev"):
+                ser.write(b"".join(bufs))
+            else:
+                self._writev_all(fd, bufs, ser.write_timeout)
+            if flush:
+                ser.flush()
+
+    @staticmethod
+    def _writev_all(fd: int, bufs: List[Union[bytes, bytearray, memoryview]], timeout: Optional[float]) -> None:
+        """writev 直到全部写出；处理部分写与 EAGAIN。常见情形一次写完，不做任何包装。"""
+        try:
+            n = os.writev(fd, bufs)
+        except BlockingIOError:
+            n = 0
+        if n == sum(map(len, bufs)):
+            return
+        # 慢路径：按字节视图跟踪剩余部分
+        views = [memoryview(b).cast("B") for b in bufs if len(b)]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # 丢弃已写完的段，截掉部分写出的段头
+            while views and n >= len(views[0]):
+                n -= len(views.pop(0))
+            if n:
+                views[0] = views[0][n:]
+            if not views:
+                return
+            wait = None if deadline is None else deadline - time.monotonic()
+            if wait is not None and wait <= 0:
+                raise serial.SerialTimeoutException("Write timeout")
+            _, ready, _ = select.select([], [fd], [], wait)
+            if not ready:
+                raise serial.SerialTimeoutException("Write timeout")
+            try:
+                n = os.writev(fd, views)
+            except BlockingIOError:
+                n = 0
 
     # ---------- 接收（回调） ----------
     def set_recv_callback(self, callback: Optional[Callable[[bytes], None]]) -> None:
@@ -78,6 +147,12 @@ class SyncSerial:
         if self._ser is None or not self._ser.is_open:
             raise RuntimeError("串口未打开，请先调用 open()")
         self._rx_stop_flag.clear()
+        if self._wakeup_r is None:
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._wakeup_r.setblocking(False)
+            self._wakeup_w.setblocking(False)
+        else:
+            self._drain_wakeup(self._wakeup_r)
         self._rx_thread = threading.Thread(target=self._rx_loop, name="SyncSerialRecv", daemon=True)
         self._rx_thread.start()
 
@@ -86,6 +161,12 @@ class SyncSerial:
         self._rx_stop_flag.set()
         th = self._rx_thread
         if th and th.is_alive():
+            # 只在线程仍在运行时唤醒，重复调用（如 stop 后再 close）不再往管道里堆字节
+            if self._wakeup_w is not None:
+                try:
+                    self._wakeup_w.send(b"x")
+                except BlockingIOError:
+                    pass  # 写端非阻塞：缓冲已满说明已有未读的唤醒字节
             th.join(timeout=timeout)
         self._rx_thread = None
 
@@ -96,22 +177,83 @@ class SyncSerial:
     def get_config(self) -> SerialConfig:
         return self.cfg
 
+    def _apply_rx_sched(self) -> None:
+        """
+        在 RX 线程内调用：按配置切换到 SCHED_FIFO 并绑核，降低接收延迟抖动。
+        Linux 上 pid=0 即作用于调用线程；平台不支持或权限不足时仅打印提示，继续以普通优先级运行。
+        """
+        prio = int(self.cfg.rt_priority)
+        cpu = int(self.cfg.rx_cpu)
+        if prio > 0:
+            try:
+                prio = min(prio, os.sched_get_priority_max(os.SCHED_FIFO))
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(prio))
+            except (AttributeError, OSError) as e:
+                print(f"[SyncSerial] 设置 RX 线程实时优先级失败: {e}")
+        if cpu >= 0:
+            try:
+                os.sched_setaffinity(0, {cpu})
+            except (AttributeError, OSError) as e:
+                print(f"[SyncSerial] 绑定 RX 线程到 CPU {cpu} 失败: {e}")
+
+    @staticmethod
+    def _drain_wakeup(wake_r: socket.socket) -> None:
+        """取走自唤醒管道中残留的字节（上次停止时线程可能未读）。"""
+        try:
+            while wake_r.recv(64):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
     # ---------- 内部线程函数 ----------
     def _rx_loop(self) -> None:
+        self._apply_rx_sched()
         chunk_size = max(1, int(self.cfg.chunk_size))
-        while not self._rx_stop_flag.is_set():
+        stop = self._rx_stop_flag
+        # close() 先停本线程再置空 _ser，循环内无需每轮加锁取串口对象；
+        # 仅在串口不可用或读异常后重新取一次
+        with self._lock:
+            ser = self._ser
+        fd = self._rx_fd(ser)
+        # 线程内持有读端引用：close() 等待超时后置空属性也不影响本线程
+        wake_r = self._wakeup_r
+        wake_fd = wake_r.fileno()
+        # 停止标志只在被唤醒或走轮询式分支时检查，select 分支不再每轮 is_set()
+        while True:
             try:
-                with self._lock:
-                    ser = self._ser
                 if ser is None or not ser.is_open:
+                    if stop.is_set():
+                        return
                     time.sleep(0.01)  # 减少空等时间
+                    with self._lock:
+                        ser = self._ser
+                    fd = self._rx_fd(ser)
                     continue
 
-                # 阻塞式读（受 timeout 限制），尽量一次取 chunk_size
-                data = ser.read(chunk_size)
-                if not data:
-                    # 超时无数据：短暂让出CPU，但不要太长
-                    continue  # 直接继续，不需要sleep
+                if fd is not None:
+                    # 有任意字节即唤醒并取走已到达的部分（至多 chunk_size），
+                    # 不必像 ser.read(n) 那样凑满 n 字节或等到读超时；无超时，停止靠自唤醒管道
+                    ready, _, _ = select.select((fd, wake_fd), (), ())
+                    if ready[-1] == wake_fd:
+                        self._drain_wakeup(wake_r)
+                        if stop.is_set():
+                            return
+                        continue
+                    try:
+                        data = os.read(fd, chunk_size)
+                    except BlockingIOError:
+                        continue  # 虚假就绪（fd 为非阻塞）
+                    if not data:
+                        # 与 PySerial 一致：可读却读到 0 字节，视为设备断开
+                        raise serial.SerialException("device reports readiness to read but returned no data")
+                else:
+                    # 非 POSIX（如 Windows）：阻塞式读（受 timeout 限制），尽量一次取 chunk_size；
+                    # select 不支持串口句柄，仍按读超时轮询停止标志
+                    if stop.is_set():
+                        return
+                    data = ser.read(chunk_size)
+                    if not data:
+                        continue  # 超时无数据
 
                 cb = self._callback
                 if cb:
@@ -122,6 +264,21 @@ class SyncSerial:
                         pass
 
             except Exception:
-                # 轻量容错：短暂休眠再继续
+                # 轻量容错：短暂休眠后重新取串口对象再继续
+                if stop.is_set():
+                    return
                 time.sleep(0.01)  # 减少错误恢复时间
+                with self._lock:
+                    ser = self._ser
+                fd = self._rx_fd(ser)
                 continue
+
+    @staticmethod
+    def _rx_fd(ser: Optional[serial.Serial]) -> Optional[int]:
+        """POSIX 下返回串口的文件描述符（供 select 等待）；不可用时返回 None，退回 ser.read。"""
+        if ser is None or os.name != "posix":
+            return None
+        try:
+            return ser.fileno()
+        except Exception:
+            return None
@@ -1,11 +1,11 @@
 # serial_app.py
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import threading
+from collections import deque
+import time
 from typing import Optional, Iterable, Tuple, Union
 
 from .serial import SyncSerial, SerialConfig
-from serial.tools import list_ports
 from core.config import save_config, load_config
 from core.paths import SERIAL_CONFIG_PATH
 from core.logger import logger
@@ -20,15 +20,19 @@ from .protocol.protocol_py.protocol_defs import Var, Msg  # 如无需要可移
 # ----------------------------------------------------------------------
 _serial: SyncSerial = SyncSerial()
 _ports = []
+# 端口扫描结果缓存：comports() 需遍历 sysfs/注册表（数十 ms），重连循环内 TTL 内直接复用
+_PORTS_TTL = 2.0
+_ports_cache_ts = 0.0
 
 _frame_codec = FrameCodec()   # 负责帧层：build / feed / parse
 _data_codec = DataCodec()     # 负责 DATA(TLV) 层：encode/decode
 
-_latest_received_frame_bytes: bytes = b""   # 最近一帧的“完整帧”（AA ... 55）
-_latest_frame_data_bytes: bytes = b""       # 最近一帧的 DATA 字段（可能为 b''）
-_latest_frame_decoded = None                # 最近一帧 DATA 的解码结果（DataPacket 或 None）
-
-_frame_lock = threading.Lock()              # 并发访问保护
+# 最近一帧快照：(完整帧 AA ... 55, DATA 字段（可能为 b''）, DATA 解码结果（DataPacket 或 None）)
+# 整体以一个元组替换：写端单次全局赋值、读端单次读取，天然得到一致快照，无需加锁
+_latest: Tuple[bytes, bytes, Optional[DataPacket]] = (b"", b"", None)
+# 最近若干帧的同构三元组（旧 → 新）；一次 chunk 解出多帧时逐帧入队，不再只留最后一帧
+_RECENT_MAXLEN = 32
+_recent: deque = deque(maxlen=_RECENT_MAXLEN)
 
 
 # ==============================
@@ -39,11 +43,24 @@ def get_serial() -> SyncSerial:
 
 
 def scan_serial_ports():
-    global _ports
+    """扫描串口；距上次扫描不足 _PORTS_TTL 秒且有结果时直接返回缓存。"""
+    global _ports, _ports_cache_ts
+    now = time.monotonic()
+    if _ports and now - _ports_cache_ts < _PORTS_TTL:
+        return _ports
+    # serial.tools 只在扫描时用到，推迟到首次扫描再导入
+    from serial.tools import list_ports
     _ports = list_ports.comports()
+    _ports_cache_ts = now
     return _ports
 
 
+def invalidate_ports_cache() -> None:
+    """使端口扫描缓存失效，下次 scan_serial_ports() 必定重新扫描（如用户手动点“扫描串口”）。"""
+    global _ports_cache_ts
+    _ports_cache_ts = 0.0
+
+
 def ports_list():
     return _ports
 
@@ -109,33 +126,32 @@ def save_serial_config():
 def _receive_callback(data: bytes) -> None:
     """
     注册给 SyncSerial 的同步回调。
-    在后台接收线程内被调用：帧层流式解析 → 取最后一帧 → 拆 DATA → 解码。
+    在后台接收线程内被调用：帧层流式解析 → 逐帧拆 DATA → 解码 → 入 _recent，并更新 _latest。
+    单帧处理失败只跳过该帧，不影响同一 chunk 内的其余帧。
     """
     if not data:
         return
     try:
         frames = _frame_codec.feed(data)  # 可能解析出 0..N 帧
-        if not frames:
-            return
-
-        last_frame = frames[-1]
-        # parse() 返回 (ver, seq, data_bytes)
-        _, _, data_bytes = _frame_codec.parse(last_frame)
-
-        if len(data_bytes) == 0:
-            decoded = None
-        else:
-            decoded = _data_codec.decode(data_bytes)
-
-        with _frame_lock:
-            global _latest_received_frame_bytes, _latest_frame_data_bytes, _latest_frame_decoded
-            _latest_received_frame_bytes = last_frame
-            _latest_frame_data_bytes = data_bytes
-            _latest_frame_decoded = decoded
-
     except Exception as e:
         # 不让异常冒泡影响串口读线程
         logger.warning(f"[Serial] 处理接收数据失败: {e}")
+        return
+
+    global _latest
+    parse = _frame_codec.parse
+    decode = _data_codec.decode
+    for frame in frames:
+        try:
+            # parse() 返回 (ver, seq, data_bytes)
+            _, _, data_bytes = parse(frame)
+            decoded = decode(data_bytes) if data_bytes else None
+        except Exception as e:
+            logger.warning(f"[Serial] 处理接收数据失败: {e}")
+            continue
+        item = (frame, data_bytes, decoded)
+        _recent.append(item)
+        _latest = item
 
 
 # ==============================
@@ -144,9 +160,9 @@ def _receive_callback(data: bytes) -> None:
 def send_data_bytes(data_bytes: bytes, *, seq: int | None = None) -> None:
     """
     直接发送已编码好的 DATA（这里只负责帧层封装）。
+    帧头/DATA/帧尾分段经 writev 一次发出，DATA 不再拷进整帧缓冲。
     """
-    frame = _frame_codec.build(data_bytes, seq=seq)
-    _serial.send(frame)
+    _serial.send_iov(_frame_codec.build_iov(data_bytes, seq=seq))
 
 
 def send_tlvs(tlvs: Iterable[Tuple[int, bytes]], *,
@@ -161,13 +177,25 @@ def send_tlvs(tlvs: Iterable[Tuple[int, bytes]], *,
     send_data_bytes(data_bytes, seq=seq)
 
 
+def send_packed(tids, lens, values, *,
+                msg: Union[int, "Msg", None] = None,
+                ver: int | None = None,
+                seq: int | None = None) -> None:
+    """
+    按并列缓冲发送：tids/lens 为逐项 T/L（bytes 或 array.array('B')），values 为各项 V 依次拼接。
+    固定形状的报文（如三个 float 的速度指令）可预先建好 tids/lens，每拍只重写 values。
+    """
+    data_bytes = _data_codec.encode_packed(tids, lens, values, msg=msg, ver=ver)
+    send_data_bytes(data_bytes, seq=seq)
+
+
 def send_kv(kv: dict, *,
             msg: Union[int, "Msg", None] = None,
             ver: int | None = None,
             seq: int | None = None) -> None:
     """
-    发送 {变量: Python值}（TLV-Data）。
-    - 固定宽度变量（在 VAR_FIXED_SIZE 中声明）可直接填 int/bool/float/bytes
+    发送 {变量: Python值}（TLV-Data）；变量可为 Var、int ID 或 YAML 变量名字符串（经 KEY_TO_VAR 反查）。
+    - 固定宽度变量（VAR_SIZE_TABLE[id] 非 0）可直接填 int/bool/float/bytes
     - 可变长变量必须传 bytes-like
     """
     data_bytes = _data_codec.encode_kv(kv, msg=msg, ver=ver)
@@ -180,20 +208,23 @@ def send_kv(kv: dict, *,
 def get_latest_frame() -> Tuple[bytes, bytes, object | None]:
     """
     返回最近一次接收到的三元组：(完整帧 bytes, DATA 字节串, DATA 解码结果或 None)。
-    使用锁保证读取一致性。
+    三元组整体原子替换，读取即一致快照。
     """
-    with _frame_lock:
-        return _latest_received_frame_bytes, _latest_frame_data_bytes, _latest_frame_decoded
+    return _latest
 
 def get_latest_decoded() -> Optional[DataPacket]:
     """返回最近一帧的 DATA 解码结果（DataPacket 或 None）。"""
-    with _frame_lock:
-        return _latest_frame_decoded
+    return _latest[2]
+
+def get_recent_frames() -> Tuple[Tuple[bytes, bytes, Optional[DataPacket]], ...]:
+    """
+    返回最近至多 _RECENT_MAXLEN 帧的三元组快照（旧 → 新），同 get_latest_frame() 的元素格式。
+    RX 积压时一次 chunk 可能解出多帧，需要不漏帧的调用方用它代替 get_latest_frame()。
+    """
+    return tuple(_recent)
 
 def reset_latest():
-    """清空“最近一帧”缓存（测试或复位时可用）。"""
-    global _latest_received_frame_bytes, _latest_frame_data_bytes, _latest_frame_decoded
-    with _frame_lock:
-        _latest_received_frame_bytes = b""
-        _latest_frame_data_bytes = b""
-        _latest_frame_decoded = None
+    """清空“最近一帧”缓存与近期帧队列（测试或复位时可用）。"""
+    global _latest
+    _latest = (b"", b"", None)
+    _recent.clear()
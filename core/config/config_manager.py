@@ -1,21 +1,67 @@
 import json
+import math
 import os
 import tempfile
 from dataclasses import asdict, fields, is_dataclass, MISSING
-from typing import Any, List, Optional, Sequence, Tuple, Type, TypeVar, Union, get_args, get_origin, Dict
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Type, TypeVar, Union, get_args, get_origin, get_type_hints, Dict
 
 from core.logger import logger
 
+# orjson 为可选依赖：可用时读写走其 C/Rust 实现（解析约 3 倍、序列化更快），否则退回标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 T = TypeVar('T')
 
 # ---------- JSON 序列化 ----------
-def _to_jsonable(obj: Any) -> Any:
-    if is_dataclass(obj):
-        return asdict(obj)
-    if isinstance(obj, (list, tuple)):
-        return [_to_jsonable(x) for x in obj]
+def _has_nonfinite(obj: Any) -> bool:
+    """对象树中是否含 NaN/±Infinity 浮点（遍历方式同编码器：容器、dataclass 字段、default 展开的对象）。"""
+    tp = type(obj)
+    if tp is float:
+        return not math.isfinite(obj)
+    if tp is str or tp is int or tp is bool or obj is None:
+        return False
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
     if isinstance(obj, dict):
-        return {k: _to_jsonable(v) for k, v in obj.items()}
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    try:
+        expanded = _encode_default(obj)
+    except TypeError:
+        return False
+    return _has_nonfinite(expanded)
+
+def _dumps_orjson(config: Any) -> Optional[bytes]:
+    """
+    用 orjson 序列化（C 层遍历 dataclass/list/dict，不先复制一棵 Python 对象树）；
+    orjson 无法如实写出时返回 None，由调用方改用标准库 json：
+    - 超出 64 位的整数：orjson 直接报错
+    - NaN/±Infinity：orjson 会静默写成 null，读回时 float 字段类型不符导致整份配置加载失败；
+      仅在输出含 null 时才遍历检查，常规配置不付这份代价
+    其余情况输出与 json.dumps(ensure_ascii=False, indent=2) 为等价 JSON，但并非逐字节相同（如 1e-7 对 1e-07）。
+    """
+    try:
+        payload = orjson.dumps(config, default=_encode_default,
+                               option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return None
+    if b'null' in payload and _has_nonfinite(config):
+        return None
+    return payload
+
+def _encode_default(obj: Any) -> Any:
+    """
+    编码器 default 回调：只处理编码器不认识的对象，list/tuple/dict/标量由编码器自行遍历。
+    dataclass 展开一层字段（嵌套的 dataclass 会再次回调）；pydantic 模型走 model_dump()/dict()。
+    """
+    tp = type(obj)
+    if _is_dataclass_type(tp):
+        return {name: getattr(obj, name) for name in _field_types(tp)}
     # pydantic 兼容（可选）
     if hasattr(obj, 'model_dump'):
         try:
@@ -27,85 +73,154 @@ def _to_jsonable(obj: Any) -> Any:
             return obj.dict()
         except Exception:
             pass
-    return obj
+    raise TypeError(f'Type is not JSON serializable: {tp.__name__}')
 
-def _ensure_dir(path: str) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+def _ensure_dir(directory: str) -> None:
+    os.makedirs(directory, exist_ok=True)
 
-def save_config(config_file: str, config: Union[T, Sequence[T]]) -> None:
+def _write_all(fd: int, payload: bytes) -> None:
+    """写完整个 payload；普通文件上一次 os.write 即写完，循环只为应对短写。"""
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+
+def save_config(config_file: str, config: Union[T, Sequence[T]], *, durable: bool = False) -> None:
+    """
+    原子写入配置（临时文件 + os.replace）：读者只会看到旧文件或完整的新文件。
+    durable=True 时在 replace 前 fsync 临时文件，确保掉电后内容也已落盘；
+    界面上的常规保存不需要这一保证，默认跳过（fsync 单次可达数毫秒到数十毫秒）。
+    """
+    # mtime 精度有限，同一时钟刻度内的重写未必能被 stat 察觉，写入时直接作废该路径的共享缓存
+    _SHARED_CACHE.pop(config_file, None)
     try:
-        data = _to_jsonable(config)
-        _ensure_dir(config_file)
+        directory = os.path.dirname(config_file)
+        _ensure_dir(directory)
 
-        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(config_file), prefix='.cfg.', suffix='.tmp')
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.cfg.', suffix='.tmp')
+        replaced = False
         try:
-            with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                f.flush(); os.fsync(f.fileno())
+            # 先整体序列化成 UTF-8 字节，再用 os.write 一次写入（不经文件对象的缓冲/编码层）
+            try:
+                payload = _dumps_orjson(config) if orjson is not None else None
+                if payload is None:
+                    # 标准库 json 带 indent 时走纯 Python 编码器，根为 dataclass 时先 asdict 实测比逐层回调略快；
+                    # 其余对象（如 dataclass 列表）交给编码器遍历，遇到 dataclass/pydantic 时经 default 展开
+                    data = asdict(config) if _is_dataclass_type(type(config)) else config
+                    payload = json.dumps(data, ensure_ascii=False, indent=2,
+                                         default=_encode_default).encode('utf-8')
+                _write_all(fd, payload)
+                if durable:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
             os.replace(tmp, config_file)
+            replaced = True
         finally:
-            try:
-                if os.path.exists(tmp):
-                    os.remove(tmp)
-            except OSError:
-                pass
-        logger.info(f'配置已成功保存到 {config_file}')
+            # 正常路径下 tmp 已被 replace 改名，无需再 stat；仅失败时清理残留临时文件
+            if not replaced:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+        logger.info('配置已成功保存到 %s', config_file)
     except Exception as e:
-        logger.error(f'保存配置时出现错误: {e}')
+        logger.error('保存配置时出现错误: %s', e)
 
 # ---------- 类型工具 ----------
+# 注解与 dataclass 的结构在运行期不变：get_origin/get_args 与 fields() 的结果按注解/类缓存，
+# 每次加载只做查表，不再重复做 typing 内省与 fields() 元组分配。
+# 注解缓存按对象身份（id）而非相等性：Union[A, B] == Union[B, A] 但参数顺序（匹配顺序）不同；
+# 缓存项同时持有注解本身，保证 id 不被复用，不可哈希的注解也能缓存。
+_ANN_INFO: Dict[int, Tuple[Any, Tuple[Any, Tuple[Any, ...]]]] = {}
+
+def _ann_info(ann: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    """返回 (get_origin(ann), get_args(ann))。"""
+    hit = _ANN_INFO.get(id(ann))
+    if hit is not None and hit[0] is ann:
+        return hit[1]
+    info = (get_origin(ann), get_args(ann))
+    _ANN_INFO[id(ann)] = (ann, info)
+    return info
+
+@lru_cache(maxsize=None)
+def _cached_fields(cls: type) -> Tuple[Tuple[str, Any, Any, Any], ...]:
+    """
+    dataclass 字段元信息：((name, type, default, default_factory), ...)。
+    模块启用 `from __future__ import annotations` 时 f.type 是字符串，这里经 get_type_hints
+    按类解析一次；解析失败（如名字仅在 TYPE_CHECKING 下可见）则保留原注解，按 Any 宽松处理。
+    """
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        hints = {}
+    return tuple((f.name, hints.get(f.name, f.type), f.default, f.default_factory) for f in fields(cls))
+
+@lru_cache(maxsize=None)
+def _field_types(cls: type) -> Dict[str, Any]:
+    """dataclass 字段名 → 注解（只读使用）。"""
+    return {name: tp for name, tp, _, _ in _cached_fields(cls)}
+
+# 类型 → 是否 dataclass；首次遇到时计算，之后一次 dict 查找
+_DATACLASS_TYPES: Dict[type, bool] = {}
+
 def _is_dataclass_type(tp: Any) -> bool:
-    return isinstance(tp, type) and is_dataclass(tp)
+    if not isinstance(tp, type):
+        return False
+    r = _DATACLASS_TYPES.get(tp)
+    if r is None:
+        r = _DATACLASS_TYPES[tp] = is_dataclass(tp)
+    return r
 
 def _is_optional(ann: Any) -> bool:
-    origin = get_origin(ann)
+    origin, args = _ann_info(ann)
     if origin is Union:
-        args = get_args(ann)
         return any(a is type(None) for a in args)
     return False
 
 def _strip_optional(ann: Any) -> Any:
-    origin = get_origin(ann)
+    origin, args = _ann_info(ann)
     if origin is Union:
-        args = tuple(a for a in get_args(ann) if a is not type(None))
+        args = tuple(a for a in args if a is not type(None))
         if len(args) == 1:
             return args[0]
         return Union[args]  # type: ignore
     return ann
 
-def _empty_value_for(ann: Any) -> Any:
+def _empty_source(ann: Any) -> Optional[str]:
     """
-    为“缺失字段”提供一个合理的留空值：
+    为“缺失字段”提供一个合理的留空值，返回生成代码中使用的表达式源码
+    （容器用字面量，每次求值得到新对象，调用方可放心写入）：
     - Optional[...]  -> None
     - 容器类型        -> 空容器
+    - 嵌套 dataclass  -> 无字面量形式，返回 None，由调用方改用 _empty_dataclass 构造
     - 其他标量/自定义 -> None（留空）
     """
     if _is_optional(ann):
-        return None
-    origin = get_origin(ann)
-    args = get_args(ann)
+        return 'None'
+    origin, args = _ann_info(ann)
 
     if origin in (list, List, Sequence):
-        return []
+        return '[]'
     if origin in (dict, Dict):
-        return {}
+        return '{}'
     if origin in (tuple, Tuple):
-        return tuple()
+        return '()'
     if _is_dataclass_type(ann):
-        # 嵌套 dataclass：全部留空（递归构造）
-        try:
-            return _build_dataclass_forgiving(ann, {})
-        except Exception:
-            return None
+        return None
     # 标量等默认 None
-    return None
+    return 'None'
+
+def _empty_dataclass(cls: type) -> Any:
+    """嵌套 dataclass 的留空值：全部字段留空（递归构造），失败则为 None。"""
+    try:
+        return _build_dataclass_forgiving(cls, {})
+    except Exception:
+        return None
 
-# ---------- 兼容性校验（只校验已存在字段） ----------
 def _is_compatible(value: Any, ann: Any) -> bool:
     if ann is Any:
         return True
-    origin = get_origin(ann)
-    args = get_args(ann)
+    origin, args = _ann_info(ann)
 
     if origin is None:
         if ann is type(None):
@@ -113,17 +228,18 @@ def _is_compatible(value: Any, ann: Any) -> bool:
         if _is_dataclass_type(ann):
             return isinstance(value, dict)
         if isinstance(ann, type):
-            return isinstance(value, ann)
+            # 精确类型命中走快路径；子类（如 bool 之于 int）仍由 isinstance 兜底，语义不变
+            return type(value) is ann or isinstance(value, ann)
         return True
     if origin is Union:
         return any(_is_compatible(value, a) for a in args)
     if origin in (list, List, Sequence):
-        if not isinstance(value, list):
+        if type(value) is not list and not isinstance(value, list):
             return False
         inner = args[0] if args else Any
         return all(_is_compatible(v, inner) for v in value)
     if origin in (dict, Dict):
-        if not isinstance(value, dict):
+        if type(value) is not dict and not isinstance(value, dict):
             return False
         kt, vt = args if len(args) == 2 else (Any, Any)
         return all(_is_compatible(k, kt) and _is_compatible(v, vt) for k, v in value.items())
@@ -137,35 +253,182 @@ def _is_compatible(value: Any, ann: Any) -> bool:
         return all(_is_compatible(v, a) for v, a in zip(value, args))
     return True
 
-def _convert_value(ann: Any, value: Any) -> Any:
-    origin = get_origin(ann)
-    args = get_args(ann)
+# ---------- 编译式转换 ----------
+# 每个注解只分析一次，生成专用的转换闭包（None 表示原样返回），每个 dataclass 用 exec 生成
+# 直线式的构造函数；加载时不再逐值做 get_origin/get_args 分派与递归。语义与逐层解释一致。
+Converter = Optional[Callable[[Any], Any]]
+_CONVERTERS: Dict[int, Tuple[Any, Converter]] = {}
 
-    if ann is Any:
+def _converter_for(ann: Any) -> Converter:
+    """按注解取（并缓存）转换函数；None 表示该注解下值原样保留。"""
+    hit = _CONVERTERS.get(id(ann))
+    if hit is not None and hit[0] is ann:
+        return hit[1]
+    conv = _make_converter(ann)
+    _CONVERTERS[id(ann)] = (ann, conv)
+    return conv
+
+def _dataclass_converter(cls: type) -> Callable[[Any], Any]:
+    # 构造函数在首次调用时才取，允许 dataclass 自引用/相互引用
+    loader = None
+
+    def conv(value: Any) -> Any:
+        nonlocal loader
+        if isinstance(value, dict):
+            if loader is None:
+                loader = _loader_for(cls)
+            return loader(value)
         return value
+    return conv
+
+def _match_predicate(ann: Any) -> Callable[[Any], bool]:
+    """与 _is_compatible(value, ann) 等价的判定闭包；非泛型注解展开为 type is/isinstance 直判。"""
+    if ann is Any:
+        return lambda value: True
+    origin, _ = _ann_info(ann)
     if origin is None:
-        if _is_dataclass_type(ann) and isinstance(value, dict):
-            return _build_dataclass_forgiving(ann, value)
-        return value
+        if ann is type(None):
+            return lambda value: value is None
+        if _is_dataclass_type(ann):
+            return lambda value: type(value) is dict or isinstance(value, dict)
+        if isinstance(ann, type):
+            return lambda value: type(value) is ann or isinstance(value, ann)
+        return lambda value: True
+    return lambda value: _is_compatible(value, ann)
+
+def _make_converter(ann: Any) -> Converter:
+    if ann is Any:
+        return None
+    origin, args = _ann_info(ann)
+    if origin is None:
+        return _dataclass_converter(ann) if _is_dataclass_type(ann) else None
     if origin is Union:
-        for a in args:
-            if a is type(None) and value is None:
+        # None 在任何 Union 下都原样返回（NoneType/Any/普通类型的转换均为原样，其余成员不接受 None），
+        # 故先判 None，其余成员按声明顺序预编译为 (判定, 转换) 分派表
+        none_type = type(None)
+        dispatch = tuple((_match_predicate(a), _converter_for(a)) for a in args if a is not none_type)
+        if all(c is None for _, c in dispatch):
+            # 所有成员都原样返回（如 Optional[int]）：整个 Union 无需转换
+            return None
+        if len(dispatch) == 1:
+            (pred, c), = dispatch
+
+            def conv_optional(value: Any) -> Any:
+                if value is not None and pred(value):
+                    return value if c is None else c(value)
+                return value
+            return conv_optional
+
+        def conv_union(value: Any) -> Any:
+            if value is None:
                 return None
-            if _is_compatible(value, a):
-                return _convert_value(a, value)
-        return value
+            for pred, c in dispatch:
+                if pred(value):
+                    return value if c is None else c(value)
+            return value
+        return conv_union
     if origin in (list, List, Sequence):
-        inner = args[0] if args else Any
-        return [ _convert_value(inner, v) for v in (value or []) ]
+        c = _converter_for(args[0] if args else Any)
+        if c is None:
+            return lambda value: list(value or [])
+        return lambda value: [c(v) for v in (value or [])]
     if origin in (dict, Dict):
         kt, vt = args if len(args) == 2 else (Any, Any)
-        return { _convert_value(kt, k): _convert_value(vt, v) for k, v in (value or {}).items() }
+        kc, vc = _converter_for(kt), _converter_for(vt)
+        if kc is None and vc is None:
+            return lambda value: dict((value or {}).items())
+        kc = kc or (lambda k: k)
+        vc = vc or (lambda v: v)
+        return lambda value: {kc(k): vc(v) for k, v in (value or {}).items()}
     if origin in (tuple, Tuple):
         if len(args) == 2 and args[1] is Ellipsis:
-            inner = args[0]
-            return tuple(_convert_value(inner, v) for v in (value or []))
-        return tuple(_convert_value(a, v) for a, v in zip(args, value))
-    return value
+            c = _converter_for(args[0])
+            if c is None:
+                return lambda value: tuple(value or [])
+            return lambda value: tuple(c(v) for v in (value or []))
+        convs = tuple(_converter_for(a) for a in args)
+        return lambda value: tuple(v if c is None else c(v) for c, v in zip(convs, value))
+    return None
+
+def _convert_value(ann: Any, value: Any) -> Any:
+    conv = _converter_for(ann)
+    return value if conv is None else conv(value)
+
+def _can_fill_dict(cls: type) -> bool:
+    """
+    能否绕过 __init__ 直接填 __dict__：要求 __init__ 为 dataclass 自动生成、
+    全部字段参与 init 且无 InitVar、非 frozen/slots、未自定义 __new__/__setattr__。
+    此时自动生成的 __init__ 只做逐字段赋值，直接写 __dict__ 结果相同。
+    """
+    params = getattr(cls, '__dataclass_params__', None)
+    init = cls.__dict__.get('__init__')
+    code = getattr(init, '__code__', None)
+    return (
+        params is not None and params.init and not params.frozen
+        and code is not None and code.co_filename == '<string>'
+        and '__slots__' not in cls.__dict__
+        and cls.__new__ is object.__new__
+        and cls.__setattr__ is object.__setattr__
+        and all(f.init for f in fields(cls))
+        and len(cls.__dataclass_fields__) == len(fields(cls))
+    )
+
+@lru_cache(maxsize=None)
+def _loader_for(cls: type) -> Callable[[dict], Any]:
+    """
+    为 dataclass 生成宽松构造函数 _load(data)，逐字段展开为直线代码：
+    有值 → 按注解转换（失败记 warning 并留空）；缺失 → default/default_factory/留空。
+    满足 _can_fill_dict 时以 object.__new__ 建实例并直接写 __dict__（再调 __post_init__），
+    省去 **kwargs 解包与 __init__ 调用；否则仍走 cls(**kwargs)。
+    """
+    ns: Dict[str, Any] = {
+        '_cls': cls, '_logger': logger, '_empty_dataclass': _empty_dataclass,
+        '_new': object.__new__,
+    }
+    direct = _can_fill_dict(cls)
+    if direct:
+        src = ['def _load(data):', '    _obj = _new(_cls)', '    kwargs = _obj.__dict__']
+    else:
+        src = ['def _load(data):', '    kwargs = {}']
+    for i, (name, ann, default, default_factory) in enumerate(_cached_fields(cls)):
+        key = repr(name)
+        ns[f'_a{i}'] = ann
+        # 留空值在生成时就定好表达式，加载时不再按注解分派
+        empty = _empty_source(ann) or f'_empty_dataclass(_a{i})'
+        conv = _converter_for(ann)
+        src.append(f'    if {key} in data:')
+        if conv is None:
+            src.append(f'        kwargs[{key}] = data[{key}]')
+        else:
+            ns[f'_c{i}'] = conv
+            src += [
+                '        try:',
+                f'            kwargs[{key}] = _c{i}(data[{key}])',
+                '        except Exception as e:',
+                f'            _logger.warning("字段 %s 转换失败，使用留空值: %s", {key}, e)',
+                f'            kwargs[{key}] = {empty}',
+            ]
+        src.append('    else:')
+        if default is not MISSING:
+            ns[f'_d{i}'] = default
+            src.append(f'        kwargs[{key}] = _d{i}')
+        elif default_factory is not MISSING:
+            ns[f'_f{i}'] = default_factory
+            src.append(f'        kwargs[{key}] = _f{i}()')
+        else:
+            # 无默认：按“留空”策略
+            src += [
+                f'        kwargs[{key}] = {empty}',
+                f'        _logger.debug("字段 %s 缺失，设置为留空值 %r", {key}, kwargs[{key}])',
+            ]
+    if not direct:
+        src.append('    return _cls(**kwargs)')
+    else:
+        if hasattr(cls, '__post_init__'):
+            src.append('    _obj.__post_init__()')
+        src.append('    return _obj')
+    exec('\n'.join(src), ns)
+    return ns['_load']
 
 # ---------- 宽松构造 ----------
 def _build_dataclass_forgiving(cls: Type[T], data: dict) -> T:
@@ -174,26 +437,9 @@ def _build_dataclass_forgiving(cls: Type[T], data: dict) -> T:
     - 只使用 cls 字段（忽略 data 中的多余键）
     - 缺失字段：default/default_factory/Optional->None/否则None（留空）
     - 嵌套/容器：递归宽松处理
+    实际构造由 _loader_for(cls) 生成的专用函数完成。
     """
-    kwargs = {}
-    for f in fields(cls):
-        if f.name in data:
-            raw = data[f.name]
-            try:
-                kwargs[f.name] = _convert_value(f.type, raw)
-            except Exception as e:
-                logger.warning(f'字段 {f.name} 转换失败，使用留空值: {e}')
-                kwargs[f.name] = _empty_value_for(f.type)
-        else:
-            if f.default is not MISSING:
-                kwargs[f.name] = f.default
-            elif f.default_factory is not MISSING:  # type: ignore
-                kwargs[f.name] = f.default_factory()  # type: ignore
-            else:
-                # 无默认：按“留空”策略
-                kwargs[f.name] = _empty_value_for(f.type)
-                logger.debug(f'字段 {f.name} 缺失，设置为留空值 {kwargs[f.name]!r}')
-    return cls(**kwargs)
+    return _loader_for(cls)(data)
 
 def _validate_config_forgiving(data: dict, cls: Type[T]) -> None:
     """
@@ -203,29 +449,67 @@ def _validate_config_forgiving(data: dict, cls: Type[T]) -> None:
     if not isinstance(data, dict):
         raise TypeError(f'配置根类型必须是对象(dict)，实际是 {type(data)}')
 
-    field_map = {f.name: f for f in fields(cls)}
-    for k, v in list(data.items()):
-        if k not in field_map:
+    field_types = _field_types(cls)
+    for k, v in data.items():
+        ann = field_types.get(k, MISSING)
+        if ann is MISSING:
             # 忽略多余字段，但给个 debug
-            logger.debug(f'忽略未知字段: {k}')
+            logger.debug('忽略未知字段: %s', k)
             continue
-        f = field_map[k]
-        if not _is_compatible(v, f.type):
-            raise TypeError(f'字段 {f.name} 类型不匹配: 期望 {f.type}, 实际 {type(v)}')
+        if not _is_compatible(v, ann):
+            raise TypeError(f'字段 {k} 类型不匹配: 期望 {ann}, 实际 {type(v)}')
 
 # ---------- 读取 ----------
-def load_config(config_file: str, config_class: Type[T]) -> Optional[T]:
-    """从文件加载配置到指定 dataclass；兼容不同版本：有值就用，缺失留空/默认。"""
+# 连续 19 位以上数字：可能是 orjson 无法按整数读回的大整数（2**63 起为 19 位），宁可多判交给标准库 json。
+# 检测时先把数字映射为 '0'、其余字节映射为空格，再做一次子串查找（均为 C 实现，比正则快一个量级）
+_DIGIT_MASK = bytes(0x30 if 0x30 <= b <= 0x39 else 0x20 for b in range(256))
+_LONG_DIGITS = b'0' * 19
+
+def _has_long_digits(raw: bytes) -> bool:
+    return _LONG_DIGITS in raw.translate(_DIGIT_MASK)
+
+# shared=True 加载的实例缓存：路径 → {类: (st_mtime_ns, st_size, 实例)}；save_config 写同一路径时清除
+_SHARED_CACHE: Dict[str, Dict[type, Tuple[int, int, Any]]] = {}
+
+def load_config(config_file: str, config_class: Type[T], *, shared: bool = False) -> Optional[T]:
+    """
+    从文件加载配置到指定 dataclass；兼容不同版本：有值就用，缺失留空/默认。
+    默认每次重新解析并构造新实例（调用方可自由修改）。
+    shared=True 用于只读的重复加载（如执行流程时反复读取子流程）：文件未变（mtime/大小相同）时
+    直接返回上次构造的同一实例，调用方不得修改它。
+    """
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        if shared:
+            st = os.stat(config_file)
+            hit = _SHARED_CACHE.get(config_file, {}).get(config_class)
+            if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                return hit[2]
+
+        if orjson is not None:
+            with open(config_file, 'rb') as f:
+                raw = f.read()
+            if _has_long_digits(raw):
+                # 可能含超出 64 位的整数：orjson 会静默读成 float，交给 json 按 int 解析
+                config_data = json.loads(raw)
+            else:
+                try:
+                    config_data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # orjson 只收严格 JSON；标准库后端写出的 NaN/Infinity（未装 orjson 时或早先保存的文件）交给 json 解析，
+                    # 两种后端写出的文件都能读回；真正损坏的文件在这里照常报错
+                    config_data = json.loads(raw)
+        else:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config_data = json.load(f)
 
         _validate_config_forgiving(config_data, config_class)
         obj = _build_dataclass_forgiving(config_class, config_data)
+        if shared:
+            _SHARED_CACHE.setdefault(config_file, {})[config_class] = (st.st_mtime_ns, st.st_size, obj)
         return obj
     except FileNotFoundError:
-        logger.error(f'配置文件不存在: {config_file}')
+        logger.error('配置文件不存在: %s', config_file)
         return None
     except Exception as e:
-        logger.error(f'配置加载时出现错误: {e}')
+        logger.error('配置加载时出现错误: %s', e)
         return None
@@ -30,6 +30,17 @@ class FieldConfigManager:
 # 全局配置管理器实例
 _field_manager: Optional[FieldConfigManager] = None
 
+# 当前场地的 Tag 名 → tag_id 扁平表，get_tag_id 一次 dict 查找即可；
+# 当前场地不存在时为 None（退回逐级查找）。经本模块的增删改/切换场地接口时重建
+_current_tag_ids: Optional[Dict[str, int]] = None
+
+def _refresh_tag_ids() -> None:
+    """按当前场地重建 _current_tag_ids"""
+    global _current_tag_ids
+    manager = _field_manager
+    field = manager.fields.get(manager.current_field) if manager is not None else None
+    _current_tag_ids = {name: tag.tag_id for name, tag in field.tags.items()} if field is not None else None
+
 def get_field_manager() -> FieldConfigManager:
     """获取场地配置管理器实例"""
     global _field_manager
@@ -37,6 +48,7 @@ def get_field_manager() -> FieldConfigManager:
         _field_manager = load_field_config()
         if _field_manager is None:
             _field_manager = FieldConfigManager()
+        _refresh_tag_ids()
 
     return _field_manager
 
@@ -58,8 +70,9 @@ def get_current_field() -> FieldConfig:
     else:
         # 如果当前场地不存在，返回第一个可用场地
         if manager.fields:
-            first_field_key = list(manager.fields.keys())[0]
+            first_field_key = next(iter(manager.fields))
             manager.current_field = first_field_key
+            _refresh_tag_ids()
             return manager.fields[first_field_key]
         else:
             return FieldConfig(name="无可用场地")
@@ -69,6 +82,7 @@ def set_current_field(field_name: str) -> bool:
     manager = get_field_manager()
     if field_name in manager.fields:
         manager.current_field = field_name
+        _refresh_tag_ids()
         return True
     return False
 
@@ -80,13 +94,28 @@ def add_tag(tag_name: str, tag_config: TagConfig, field_name: Optional[str] = No
     if field_name in manager.fields:
         field = manager.fields[field_name]
         field.tags[tag_name] = tag_config
+        _refresh_tag_ids()
+        return True
+    return False
+
+def remove_tag(tag_name: str, field_name: Optional[str] = None) -> bool:
+    """从当前（或指定）场地删除Tag配置"""
+    manager = get_field_manager()
+    if field_name is None:
+        field_name = manager.current_field
+    if field_name in manager.fields and tag_name in manager.fields[field_name].tags:
+        del manager.fields[field_name].tags[tag_name]
+        _refresh_tag_ids()
         return True
     return False
 
 def get_tag_id(tag_name: str, field_name: Optional[str] = None) -> int:
-    """获取当前场地的指定Tag ID"""
+    """获取当前场地的指定Tag ID；未配置该Tag时返回 -1"""
     manager = get_field_manager()
     if field_name is None:
+        tag_ids = _current_tag_ids
+        if tag_ids is not None:
+            return tag_ids.get(tag_name, -1)
         field_name = manager.current_field
     return manager.fields[field_name].tags.get(tag_name, TagConfig(tag_id=-1)).tag_id
 
@@ -99,6 +128,7 @@ def add_field(key: str, field_config: FieldConfig):
     """添加新场地配置"""
     manager = get_field_manager()
     manager.fields[key] = field_config
+    _refresh_tag_ids()
 
 def remove_field(key: str) -> bool:
     """删除场地配置"""
@@ -108,8 +138,9 @@ def remove_field(key: str) -> bool:
         # 如果删除的是当前场地，切换到第一个可用场地
         if manager.current_field == key:
             if manager.fields:
-                manager.current_field = list(manager.fields.keys())[0]
+                manager.current_field = next(iter(manager.fields))
             else:
                 manager.current_field = ""
+        _refresh_tag_ids()
         return True
     return False
\ No newline at end of file
@@ -1,8 +1,11 @@
 # core/logger.py
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Optional, Callable
+from typing import Dict, Optional, Callable
 
 from nicegui import ui
 
@@ -18,6 +21,11 @@ _FMT = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
 # UI 使用的极简格式（仅消息体）
 _UI_FMT = logging.Formatter('%(message)s')
 
+# 控制台/文件 handler 挂在后台 QueueListener 上：调用方只做消息插值与一次入队，
+# 时间戳/格式化与 write() 都在监听线程完成（UiHandler 需要 UI 上下文，仍同步调用）。
+# 按 logger 名记录，同名 Logger 重复构造时复用
+_LISTENERS: Dict[str, QueueListener] = {}
+
 
 class UiHandler(logging.Handler):
     """
@@ -67,14 +75,23 @@ class Logger:
                  ui_level: int = logging.INFO,
                  logfile: Optional[str] = None):
         self._logger = logging.getLogger(name)
-        self._logger.setLevel(logging.DEBUG)
+        # logger 本身的级别取各 handler 的最低级别：更低级别的记录没有 handler 会输出，
+        # 在 _log 入口经 isEnabledFor（标准库按级别缓存结果）直接丢弃，不再构造 LogRecord
+        self._logger.setLevel(min(console_level, file_level, ui_level))
 
-        # 控制台 handler（只添加一次）
-        if not any(isinstance(h, logging.StreamHandler) for h in self._logger.handlers):
+        # 控制台 handler 经队列交给后台线程输出（只添加一次）
+        self._listener = _LISTENERS.get(name)
+        if self._listener is None:
             ch = logging.StreamHandler()
             ch.setLevel(console_level)
             ch.setFormatter(_FMT)
-            self._logger.addHandler(ch)
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            self._listener = QueueListener(log_queue, ch, respect_handler_level=True)
+            self._listener.start()
+            # 退出时停止监听线程，并把队列中剩余的记录写完
+            atexit.register(self._listener.stop)
+            _LISTENERS[name] = self._listener
+            self._logger.addHandler(QueueHandler(log_queue))
 
         # 用于后台任务 UI 安全通知的容器引用（由 set_ui_target 设置）
         self._ui_container: Optional[ui.element] = None
@@ -110,7 +127,8 @@ class Logger:
             fh = logging.FileHandler(self._logfile_path, encoding='utf-8')
             fh.setLevel(self._file_level)
             fh.setFormatter(_FMT)
-            self._logger.addHandler(fh)
+            # 文件写入同样交给监听线程；监听线程每条记录都重新读取 handlers，直接替换元组即可
+            self._listener.handlers = self._listener.handlers + (fh,)
             self._file_handler = fh
         except Exception as e:
             # 失败也要在控制台可见
@@ -123,6 +141,9 @@ class Logger:
 
     # ---------- 统一记录入口 ----------
     def _log(self, level: int, msg, *args, **kwargs) -> None:
+        """消息建议用 %-style 参数（logger.debug('x=%s', x)），被丢弃时不会格式化。"""
+        if not self._logger.isEnabledFor(level):
+            return
         if level >= self._file_level and self._file_handler is None:
             self._ensure_file_handler()
         self._logger.log(level, msg, *args, **kwargs)
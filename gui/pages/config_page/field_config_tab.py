@@ -8,7 +8,7 @@ def render_field_config_tab():
     from core.config.field_config import (
         get_field_manager, get_current_field, set_current_field,
         list_available_fields, save_field_config, add_field, remove_field,
-        add_tag
+        add_tag, remove_tag
     )
     
     ui.label('场地配置管理').classes('text-h6')
@@ -96,13 +96,10 @@ def render_field_config_tab():
                         ui.label('当前场地没有配置任何Tags').classes('text-body2 text-grey-6')
             
             def delete_tag(tag_name: str):
-                manager = get_field_manager()
-                if manager.current_field in manager.fields:
-                    if tag_name in manager.fields[manager.current_field].tags:
-                        del manager.fields[manager.current_field].tags[tag_name]
-                        # 移除自动保存，需要手动点击保存按钮
-                        ui.notify(f'Tag "{tag_name}" 已删除', type='info')
-                        refresh_tags()
+                if remove_tag(tag_name):
+                    # 移除自动保存，需要手动点击保存按钮
+                    ui.notify(f'Tag "{tag_name}" 已删除', type='info')
+                    refresh_tags()
             
             refresh_tags()
             
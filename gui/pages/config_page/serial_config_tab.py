@@ -4,7 +4,7 @@ from nicegui import ui
 from core.logger import logger
 from communicate import (
 start_serial, stop_serial, 
-scan_serial_ports, get_serial,
+scan_serial_ports, invalidate_ports_cache, get_serial,
 save_serial_config, 
 select_serial_port,
 ports_list
@@ -42,6 +42,7 @@ def render_serial_config_tab() -> None:
         save_button = ui.button('保存配置', color='secondary', on_click=lambda e: on_save_config())
         def on_scan_serial_ports():
             try:
+                invalidate_ports_cache()  # 手动扫描总是重新枚举
                 scan_serial_ports()
                 logger.info('串口扫描完成')
                 # 延迟一点时间让用户看到提示，然后刷新页面
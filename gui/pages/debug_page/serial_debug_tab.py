@@ -1,6 +1,5 @@
 from typing import Optional
 import binascii
-import struct
 from nicegui import ui
 from core.logger import logger
 
@@ -12,7 +11,11 @@ from communicate import (
     get_latest_frame,   # ← communicate(serial_app) 里暴露
     send_kv,            # ← communicate(serial_app) 里暴露（内部会封帧+发送）
     Var,
-    VAR_META
+    VAR_META,
+    VType,
+    VAR_VTYPE_TBL,
+    VAR_KEY_TBL,
+    UNPACK_BY_VTYPE,
 )
 
 def _hex(b: bytes, sep: str = ' ') -> str:
@@ -22,11 +25,13 @@ def _hex(b: bytes, sep: str = ' ') -> str:
     return sep.join(h[i:i+2] for i in range(0, len(h), 2))
 
 def _vmeta(vid: int):
-    """返回 (disp_name, vtype:str|None, size:int|None)。disp_name 优先用 key，退回枚举名或 0xID。"""
-    meta = VAR_META.get(int(vid)) or {}
-    key = meta.get('key')
-    vtype = meta.get('vtype')
-    size = meta.get('size')
+    """返回 (disp_name, vtype:VType 码, size:int|None)。disp_name 优先用 key，退回枚举名或 0xID。"""
+    if 0 <= vid <= 0xFF:
+        key, vcode = VAR_KEY_TBL[vid], VAR_VTYPE_TBL[vid]
+    else:
+        key, vcode = None, VType.UNKNOWN
+    meta = VAR_META.get(vid)
+    size = meta.size if meta is not None else None
     try:
         enum_name = Var(int(vid)).name
     except Exception:
@@ -37,58 +42,58 @@ def _vmeta(vid: int):
         disp = enum_name  # 枚举名（如 TEST_VAR_U16）
     else:
         disp = f"0x{int(vid):02X}"
-    return disp, (vtype.upper() if isinstance(vtype, str) else None), size
+    return disp, vcode, size
+
+def _int_le(width: int, signed: bool, tag: str):
+    def fmt(v_bytes: bytes) -> str:
+        return f"{int.from_bytes(v_bytes[:width], 'little', signed=signed)} ({tag}) | hex={_hex(v_bytes)}"
+    return fmt
+
+_UNPACK_F32 = UNPACK_BY_VTYPE[VType.F32LE]
 
-def _decode_by_type(vtype: Optional[str], v_bytes: bytes) -> str:
+def _f32_le(v_bytes: bytes) -> str:
+    if len(v_bytes) >= 4:
+        val = _UNPACK_F32(v_bytes)[0]
+        return f"{val:.6g} (f32) | hex={_hex(v_bytes)}"
+    return f"(len<{4}) hex={_hex(v_bytes)}"
+
+def _text(v_bytes: bytes) -> str:
+    # 尝试 utf-8 展示（可读性更好），失败则仅 hex
+    try:
+        s = v_bytes.decode('utf-8')
+        return f'"{s}" (utf8,{len(v_bytes)}B) | hex={_hex(v_bytes)}'
+    except Exception:
+        return f"({len(v_bytes)}B) hex={_hex(v_bytes)}"
+
+# 按 VType 码直接下标的展示函数表；None 表示仅显示 hex（含 BE 类型与未定义）
+_DECODERS_BY_CODE = {
+    VType.U8: _int_le(1, False, "u8"),
+    VType.BOOL: _int_le(1, False, "u8"),
+    VType.I8: _int_le(1, True, "i8"),
+    VType.U16LE: _int_le(2, False, "u16"),
+    VType.I16LE: _int_le(2, True, "i16"),
+    VType.U32LE: _int_le(4, False, "u32"),
+    VType.I32LE: _int_le(4, True, "i32"),
+    VType.F32LE: _f32_le,
+    VType.BYTES: _text,
+    VType.STR: _text,
+}
+_DECODERS = tuple(_DECODERS_BY_CODE.get(code) for code in range(max(VType) + 1))
+
+def _decode_by_type(vcode: int, v_bytes: bytes) -> str:
     """
-    按 VAR_META 的 vtype 进行人类可读展示；未知类型仅显示 hex。
+    按 VAR_VTYPE_TBL 的类型码进行人类可读展示；未知类型仅显示 hex。
     统一默认小端（与当前协议一致）。
     """
     if not v_bytes:
         return "(0B)"
-    if not vtype:
+    fmt = _DECODERS[vcode] if vcode < len(_DECODERS) else None
+    if fmt is None:
         return _hex(v_bytes)
-
     try:
-        if vtype in ("U8", "BOOL", "BYTE"):
-            return f"{v_bytes[0]} (u8) | hex={_hex(v_bytes)}"
-        if vtype == "I8":
-            return f"{int.from_bytes(v_bytes[:1], 'little', signed=True)} (i8) | hex={_hex(v_bytes)}"
-
-        if vtype in ("U16", "U16LE"):
-            return f"{int.from_bytes(v_bytes[:2], 'little', signed=False)} (u16) | hex={_hex(v_bytes)}"
-        if vtype in ("I16", "I16LE"):
-            return f"{int.from_bytes(v_bytes[:2], 'little', signed=True)} (i16) | hex={_hex(v_bytes)}"
-
-        if vtype in ("U32", "U32LE"):
-            return f"{int.from_bytes(v_bytes[:4], 'little', signed=False)} (u32) | hex={_hex(v_bytes)}"
-        if vtype in ("I32", "I32LE"):
-            return f"{int.from_bytes(v_bytes[:4], 'little', signed=True)} (i32) | hex={_hex(v_bytes)}"
-
-        if vtype in ("F32", "F32LE"):
-            if len(v_bytes) >= 4:
-                val = struct.unpack('<f', v_bytes[:4])[0]
-                return f"{val:.6g} (f32) | hex={_hex(v_bytes)}"
-            return f"(len<{4}) hex={_hex(v_bytes)}"
-
-        if vtype in ("F64", "F64LE"):
-            if len(v_bytes) >= 8:
-                val = struct.unpack('<d', v_bytes[:8])[0]
-                return f"{val:.6g} (f64) | hex={_hex(v_bytes)}"
-            return f"(len<{8}) hex={_hex(v_bytes)}"
-
-        # 变长类
-        if vtype in ("BYTES", "STR", "STRING", "UTF8", "ASCII"):
-            # 尝试 utf-8 展示（可读性更好），失败则仅 hex
-            try:
-                s = v_bytes.decode('utf-8')
-                return f'"{s}" (utf8,{len(v_bytes)}B) | hex={_hex(v_bytes)}'
-            except Exception:
-                return f"({len(v_bytes)}B) hex={_hex(v_bytes)}"
-
+        return fmt(v_bytes)
     except Exception:
-        pass
-    return _hex(v_bytes)
+        return _hex(v_bytes)
 
 def _fmt_decoded(decoded) -> str:
     """
@@ -130,9 +135,9 @@ def _fmt_decoded(decoded) -> str:
                 t_int = t
             v_bytes = bytes(v)
 
-            name, vtype, _size = _vmeta(t_int)
+            name, vcode, _size = _vmeta(t_int)
             t_disp = f"{name}(0x{t_int:02X})" if isinstance(t_int, int) else str(t_int)
-            v_disp = _decode_by_type(vtype, v_bytes)
+            v_disp = _decode_by_type(vcode, v_bytes)
 
             lines.append(f"  - T={t_disp} L={len(v_bytes)} V={v_disp}")
         return '\n'.join(lines)
@@ -260,10 +265,10 @@ def render_serial_tab() -> None:
                 # 从protocol_defs获取所有变量，按首字母分组
                 all_vars = []
                 for var_enum in Var:
-                    var_meta = VAR_META.get(int(var_enum), {})
+                    var_meta = VAR_META[int(var_enum)]
                     var_name = var_enum.name
-                    var_type = var_meta.get('vtype', 'UNKNOWN')
-                    var_key = var_meta.get('key', var_name.lower())
+                    var_type = var_meta.vtype
+                    var_key = var_meta.key
                     all_vars.append((var_name, var_type, var_enum, var_key))
                 
                 # 按首字母分组
@@ -342,8 +347,7 @@ def render_serial_tab() -> None:
                             for var_enum, checkbox in var_checkboxes.items():
                                 if checkbox.value:
                                     input_ctrl = var_inputs[var_enum]
-                                    var_meta = VAR_META.get(int(var_enum), {})
-                                    var_type = var_meta.get('vtype', 'UNKNOWN')
+                                    var_type = VAR_META[int(var_enum)].vtype
                                     
                                     if var_type == "BOOL":
                                         value = bool(input_ctrl.value)
@@ -74,9 +74,9 @@ def save_operation_manager() -> None:
     if _operation_manager is not None:
         save_config(OPERATION_MANAGER_PATH, _operation_manager)
 
-def load_operation_config(operation_name: str) -> Optional[OperationConfig]:
-    """从文件加载工作流程配置"""
-    return load_config(OPERATION_CONFIG_PATH(operation_name), OperationConfig)
+def load_operation_config(operation_name: str, *, shared: bool = False) -> Optional[OperationConfig]:
+    """从文件加载工作流程配置；shared=True 时文件未变则复用上次的只读实例（见 load_config）"""
+    return load_config(OPERATION_CONFIG_PATH(operation_name), OperationConfig, shared=shared)
 
 def save_operation_config(operation_name: str, config: OperationConfig) -> None:
     """保存工作流程配置到文件"""
@@ -300,7 +300,8 @@ class TaskExecutor:
             return False
 
         from operations.config.operation_config import load_operation_config
-        subflow_config = load_operation_config(subflow_name)
+        # 子流程在循环/递归中会被反复执行，且这里只读不改，复用未变文件的实例
+        subflow_config = load_operation_config(subflow_name, shared=True)
         if not subflow_config or not getattr(subflow_config, 'nodes', None):
             set_debug_var('error', f'Invalid subflow config: {subflow_name}',
                           DebugLevel.ERROR, DebugCategory.ERROR, f"无效的子流程配置: {subflow_name}")
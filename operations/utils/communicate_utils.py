@@ -1,4 +1,4 @@
-from communicate import Var, send_kv, get_latest_decoded, VAR_META
+from communicate import Var, VType, VAR_VTYPE_TBL, send_kv, get_latest_decoded
 from communicate.protocol.protocol_py.data import _as_float32_le, _unpack_fixed_le_int
 import time
 from time import sleep
@@ -6,23 +6,14 @@ from typing import Literal, Optional, Any
 from communicate.protocol.protocol_py.data import DataPacket
 import math
 
-# ---- 私有辅助：根据 VAR_META 解析 ----
-def _parse_value_by_meta(var: Var, raw_bytes: bytes) -> Any:
-    meta = VAR_META.get(int(var))
-    if not meta:
-        # 尝试兜底解成整型；失败则返回 None
-        try:
-            return _unpack_fixed_le_int(raw_bytes)
-        except Exception:
-            return None
+_VT_F32 = int(VType.F32LE)
 
-    vtype = meta.get("vtype")
+# ---- 私有辅助：按 VAR_VTYPE_TBL 类型码解析 ----
+def _parse_value_by_meta(var: Var, raw_bytes: bytes) -> Any:
     try:
-        if vtype == "F32":
+        if VAR_VTYPE_TBL[var] == _VT_F32:
             return _as_float32_le(raw_bytes)
-        if vtype in ["BOOL", "U8", "U16", "U32"]:
-            return _unpack_fixed_le_int(raw_bytes)
-        # 未知类型：兜底按整型解析
+        # 整型/布尔与未定义类型：统一按小端整型解析
         return _unpack_fixed_le_int(raw_bytes)
     except Exception:
         return None
@@ -83,7 +74,7 @@ def wait_for_ack(var: Var, expected_value: int, timeout: float = -1) -> bool:
 def wait_for_value(var: Var, timeout: float = 5.0):
     """
     等待指定变量并返回解析后的值（保持原签名与语义）
-    - 解析更健壮：优先按 VAR_META，失败兜底整型
+    - 解析更健壮：优先按 VAR_VTYPE_TBL 类型码，失败兜底整型
     - 严格超时：timeout <= 0 视为立刻超时
     - 不强制“只接受新值”，以免影响读取类场景
     """